@@ -1,4 +1,6 @@
 # Configuration file for the Sphinx documentation builder.
+# This conf supports parallel builds: all extensions below are parallel read/write safe,
+# and 'make html' passes '-j auto' by default (see SPHINXOPTS in the Makefile).
 
 
 import os
@@ -31,6 +33,10 @@ myst_enable_extensions = ["dollarmath", "amsmath"]
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
+# Mock the package's heavy runtime dependencies so autodoc never imports them during a docs build
+autodoc_mock_imports = ["pandas", "numpy", "requests", "yaml", "rich", "plotly", "ipywidgets", "IPython"]
+suppress_warnings = ["config.cache"]      # Sphinx >= 7.3 warns about unpicklable config values, which disables the environment cache
+
 
 
 # -- Options for HTML output -------------------------------------------------
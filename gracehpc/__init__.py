@@ -1,4 +1,13 @@
-from .script import gracehpc_run
-from .jupyter import jupyter_UI
+__all__ = ["gracehpc_run", "jupyter_UI"]
 
-__all__ = ["gracehpc_run", "jupyter_UI"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolve the public API lazily so the 'gracehpc' CLI entry point (gracehpc.cli:main) does not
+    # import pandas, plotly and ipywidgets just to print help or write the config file.
+    if name == "gracehpc_run":
+        from .script import gracehpc_run
+        return gracehpc_run
+    if name == "jupyter_UI":
+        from .jupyter import jupyter_UI
+        return jupyter_UI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -25,6 +25,8 @@ User Arguments Available:
     --Region: Region the HPC cluster is located in (for realtime carbon intensity data), default is 'UK_average'. E.g. 'South West England' for Isambard systems.
     --Scope3: Scope 3 per node-hour emissions factor. Options include: 'Isambard3', 'IsambardAI', 'Archer2', or a custom value in gCO2e/nodeh, default = 'no_scope3'
     --CSV: Save the final dataframes to CSV files. Options include 'all', 'full', 'daily', 'total', 'full_summary', 'daily_summary, 'total_summary'. default = 'no_save'
+    --Format: File format used when saving the dataframes selected with --CSV. Options include 'csv' or 'parquet' (requires pyarrow), default = 'csv'
+    --Engine: Dataframe library used to merge the job steps and for the daily aggregation. Options include 'pandas' or 'polars' (requires polars and pyarrow), default = 'pandas'
     --help: For more information on available arguments and their usage.
 """
 
@@ -32,12 +34,26 @@ User Arguments Available:
 import argparse
 import os 
 import sys
-import datetime
+import time
 
-# Import functions and classes from the package
-from .core.emissions_calculator import core_engine
-from .config import generate_config_file
-from .interface.cli_script_output import main_cli_script_output
+# The package's own modules are imported inside the subcommand branches of main() so that
+# 'gracehpc --help' and 'gracehpc configure' do not pay the pandas/numpy/requests/rich import cost.
+
+
+# Help text for the main argument parser (module-level so it is built once, not on every call to main())
+_DESC = (
+    " \n\nGRACE-HPC: A Green Resource for Assessing Carbon & Energy in HPC.\n\n\n"
+    "This tool estimates the energy consumption, scope 2 and scope 3 carbon emissions of your SLURM HPC jobs.\n"
+    "If energy counters are available, it will use them. Otherwise it will estimate energy and emissions from usage statistics. ")
+
+_EPILOG = (
+    " \n\nCarbon intensity for scope 2 emissions (operational) is retrieved from the regional Carbon Intensity API (carbonintensity.org.uk.) at the time of job submission. "
+    "Scope 3 emissions (embodied) are estimated from the node-hours used by the job, and the scope 3 emissions factor. For Isambard systems and Archer2, these scope 3 factors are calculated from "
+    "the total lifecycle scope 3 emissions for each system divided by the total node-hours available over the system's projected lifetime.\n\n\n ")
+
+
+# Predefined --Scope3 options (any other value must be a number in gCO2e/node-hour)
+_SCOPE3_OPTIONS = ("no_scope3", "Isambard3", "IsambardAI", "Archer2")
 
 
 def confirm_date_args(arguments):
@@ -47,50 +63,69 @@ def confirm_date_args(arguments):
     Raises:
         ValueError: If the date format is incorrect or if StartDate is after EndDate.
     """
-    # Loop over both date arguments 
+    import datetime     # only needed when validating 'run' arguments
+
+    # Parse both date arguments once (the parsed dates are reused for the ordering check below)
+    parsed_dates = []
     for date in [arguments.StartDate, arguments.EndDate]:
         try:
-            datetime.datetime.strptime(date, "%Y-%m-%d")
+            parsed_dates.append(datetime.datetime.strptime(date, "%Y-%m-%d").date())
         except ValueError:
             # Print an error message if format is incorrect
             raise ValueError(f"Invalid format for StartDate or EndDate: {date}. Please use 'YYYY-MM-DD' format.")
         
     # Check if StartDate is after EndDate
-    start_date = datetime.datetime.strptime(arguments.StartDate, "%Y-%m-%d")
-    end_date = datetime.datetime.strptime(arguments.EndDate, "%Y-%m-%d")
+    start_date, end_date = parsed_dates
     if start_date > end_date:
         raise ValueError(f"StartDate: {arguments.StartDate} is after EndDate: {arguments.EndDate}. Please ensure StartDate is before EndDate.")
 
 
-def main():
+def scope3_arg(value):
     """
-    Main function to handle command-line arguments.
+    Argparse type function that validates the --Scope3 argument when the command line is parsed, 
+    so an invalid value is reported straight away (before any job logs are retrieved).
+
+    Args:
+        value (str): The --Scope3 value entered by the user.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not one of the predefined options or a number.
+
+    Returns:
+        str: The validated value (unchanged).
     """
-    # Create an main argument parser for the CLI
-    arg_parser = argparse.ArgumentParser(prog="gracehpc", description=(
-        " \n\nGRACE-HPC: A Green Resource for Assessing Carbon & Energy in HPC.\n\n\n" 
-        "This tool estimates the energy consumption, scope 2 and scope 3 carbon emissions of your SLURM HPC jobs.\n" 
-        "If energy counters are available, it will use them. Otherwise it will estimate energy and emissions from usage statistics. "),
-    epilog=(
-        " \n\nCarbon intensity for scope 2 emissions (operational) is retrieved from the regional Carbon Intensity API (carbonintensity.org.uk.) at the time of job submission. " 
-        "Scope 3 emissions (embodied) are estimated from the node-hours used by the job, and the scope 3 emissions factor. For Isambard systems and Archer2, these scope 3 factors are calculated from " 
-        "the total lifecycle scope 3 emissions for each system divided by the total node-hours available over the system's projected lifetime.\n\n\n "),
-        formatter_class=argparse.RawTextHelpFormatter)  # Use RawTextHelpFormatter to preserve newlines in help text
+    if value in _SCOPE3_OPTIONS:
+        return value
+    try:
+        float(value)        # custom per node-hour emissions factor
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid Scope3 option: '{value}'. Please enter a valid number or one of the predefined options: 'Isambard3', 'IsambardAI', 'Archer2' or 'no_scope3'.")
+    return value
 
-    # Add subparsers for 'configure' and 'run' commands
-    subparsers = arg_parser.add_subparsers(dest="command", help="Subcommands")
-    
-    # Command: gracehpc configure (no arguments needed for this command)
-    configure_subcommand =  subparsers.add_parser("configure", help="Generate and save the HPC cluster configuration file. Fill in the YAML file with your HPC configuration details before using the tool.")
 
-    # Command: gracehpc run
-    run_subcommand = subparsers.add_parser("run", help="Run the full engine to estimate the carbon footprint (scope 2 and scope 3) of your SLURM HPC jobs.")
+def default_dates():
+    """
+    Function that returns the default date range for the 'run' subcommand using the 'time' module
+    (already loaded by the interpreter) rather than importing 'datetime'.
 
+    Returns:
+        tuple (str, str): Default StartDate (January 1st of the current year) and default EndDate (the current date), in 'YYYY-MM-DD' format.
+    """
+    return time.strftime("%Y-01-01"), time.strftime("%Y-%m-%d")
+
+
+def add_run_args(run_subcommand):
+    """
+    Function that adds the user arguments to the 'run' subcommand parser.
+    Kept separate from main() so the arguments are only constructed when 'gracehpc run' is called.
+
+    Args:
+        run_subcommand (argparse.ArgumentParser): The subparser for the 'run' command.
+    """
     # ---------------------------------------
     # ADD ARGUMENTS TO THE 'run' SUBCOMMAND
     # ---------------------------------------
-    SD_default = f"{datetime.date.today().year}-01-01"      # Set the default start date January 1st of the current year    
-    ED_default = datetime.date.today().strftime("%Y-%m-%d")  # Set the default end date to the current date
+    SD_default, ED_default = default_dates()
 
     # Date range arguments 
     run_subcommand.add_argument("--StartDate", 
@@ -120,7 +155,7 @@ def main():
     
     # Adding Scope 3 emissions or not 
     run_subcommand.add_argument("--Scope3",
-                                type=str,
+                                type=scope3_arg,
                                 default="no_scope3",
                                 help=(
                                     "Include scope 3 emissions for either: 'Isambard3', 'IsambardAI', 'Archer2', or a custom numeric value in gCO2e/node-hour for other HPC systems. Default: 'no_scope3'. "
@@ -138,6 +173,54 @@ def main():
                                     "'all' : all of the above datasets saved to CSV files. Default: 'no_save'."
                                 ))
     
+    # File format for the saved datasets 
+    run_subcommand.add_argument("--Format",
+                                type=str,
+                                default="csv",
+                                choices=["csv", "parquet"],
+                                help=(
+                                    "File format used to save the datasets selected with --CSV. "
+                                    "Options: 'csv' or 'parquet' (compressed columnar format, smaller and faster to write and load; requires pyarrow). Default: 'csv'."
+                                ))
+    
+    # Dataframe library used for the aggregation 
+    run_subcommand.add_argument("--Engine",
+                                type=str,
+                                default="pandas",
+                                choices=["pandas", "polars"],
+                                help=(
+                                    "Dataframe library used to merge the job steps into jobs and to aggregate the jobs by day. "
+                                    "Options: 'pandas' or 'polars' (multi-threaded lazy aggregation, faster for very large numbers of jobs; requires polars and pyarrow). Default: 'pandas'."
+                                ))
+
+
+def main():
+    """
+    Main function to handle command-line arguments.
+    """
+    # Create an main argument parser for the CLI
+    arg_parser = argparse.ArgumentParser(prog="gracehpc", description=_DESC, epilog=_EPILOG,
+        formatter_class=argparse.RawTextHelpFormatter,  # Use RawTextHelpFormatter to preserve newlines in help text
+        allow_abbrev=False)
+
+    # Add subparsers for 'configure' and 'run' commands
+    subparsers = arg_parser.add_subparsers(dest="command", help="Subcommands")
+    
+    # Command: gracehpc configure (no arguments needed for this command)
+    configure_subcommand =  subparsers.add_parser("configure", help="Generate and save the HPC cluster configuration file. Fill in the YAML file with your HPC configuration details before using the tool.")
+
+    # Command: gracehpc run
+    run_subcommand = subparsers.add_parser("run", help="Run the full engine to estimate the carbon footprint (scope 2 and scope 3) of your SLURM HPC jobs.")
+
+    # Only build the 'run' arguments when that subcommand is actually being invoked
+    # ('gracehpc configure' and the top-level help never need them)
+    if sys.argv[1:2] == ["run"]:
+        add_run_args(run_subcommand)
+
+    # Bare 'gracehpc' (no subcommand): print the help straight away without parsing
+    if len(sys.argv) == 1:
+        arg_parser.print_help()
+        sys.exit(1)
 
     # Parse CLI arguments
     arguments = arg_parser.parse_args()
@@ -145,6 +228,8 @@ def main():
     
     # Handle the 'gracehpc configure' command
     if arguments.command == "configure": 
+        from .config import generate_config_file
+
         # call generation function to create the hpc_config.yaml file
         generate_config_file()
         # Stop the script 
@@ -152,6 +237,9 @@ def main():
 
     # Handle the 'gracehpc run' command
     elif arguments.command == "run":
+        # Heavy imports (backend and terminal frontend) are only needed for this subcommand
+        from .core.emissions_calculator import core_engine
+        from .interface.cli_script_output import main_cli_script_output
 
         try:
             confirm_date_args(arguments)  # Check if the date arguments are valid
@@ -6,30 +6,32 @@ Student ID: 2046374
 Date: 11/07/25
 
 Contains a function to generate a configuration file containing required HPC system details 
-for the user to fill in before using the GRACE-HPC tool.
+for the user to fill in before using the GRACE-HPC tool, and a function to load the filled-in
+configuration file ('load_hpc_config') used by the backend and frontends.
+
+The template itself is held in the module-level '_CONFIG_TEMPLATE' bytes constant, so it is
+created once at import and reused by every call to 'generate_config_file()'.
 """
 
 # Import libraries 
 import os 
+import copy as _copy
+from collections import OrderedDict
 import yaml 
 
-def generate_config_file():
-    """
-    Generates and saves a template hpc_config.yaml file in the user's current working directory.
-    The user must fill in this file with their specific HPC system's configuration details before using the tool.
-    Edit the placeholder values (e.g. the values inside < > ) with their actual HPC system details.
-    If the file already exists a new one is not created. To use the tool, the user must have correctly
-    filled in this file and kept it in the same directory.
-    """
-    config_file = "hpc_config.yaml"
+# Use the libyaml C loader when PyYAML was built with it (much faster parsing), otherwise the pure Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-    # Check that the file does not already exist
-    if os.path.exists(config_file):
-        print(f"⚠️   {config_file} already exists in the current directory (no new file created). Ensure you have filled it in with your HPC system details before using the tool.")
-        return
-    
-    # Create the configuration file template
-    template = """\
+# Cache of parsed configuration files: absolute path -> ((st_mtime_ns, st_size), config dict). Bounded to the most recently used entries.
+_YAML_CACHE = OrderedDict()
+_YAML_CACHE_SIZE = 16
+
+# Configuration file template, stored as a bytes constant so it is built once at import
+# and written without text-mode encoding
+_CONFIG_TEMPLATE = b"""\
 # ----------------------------------------------------------------------------------------------------------------
 # GRACE-HPC CONFIGURATION FILE
 # ----------------------------------------------------------------------------------------------------------------
@@ -87,12 +89,76 @@ electricity_cost: 0.2573            # (float)  Average Cost of electricity in th
 
 
 """
-    # Write the config file 
-    with open(config_file, "w") as f:
-        f.write(template)
+
+
+def generate_config_file():
+    """
+    Generates and saves a template hpc_config.yaml file in the user's current working directory.
+    The user must fill in this file with their specific HPC system's configuration details before using the tool.
+    Edit the placeholder values (e.g. the values inside < > ) with their actual HPC system details.
+    If the file already exists a new one is not created. To use the tool, the user must have correctly
+    filled in this file and kept it in the same directory.
+    """
+    config_file = "hpc_config.yaml"
+
+    # Create the file only if it does not already exist (O_EXCL makes the check and creation a single atomic step)
+    try:
+        fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        print(f"⚠️   {config_file} already exists in the current directory (no new file created). Ensure you have filled it in with your HPC system details before using the tool.")
+        return
+    
+    # Write the config file (the template is already encoded as bytes)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_CONFIG_TEMPLATE)
 
     print(f"✅ {config_file} saved in your current directory. Please edit the placeholders < > accordingly following the guidance given in the file. Input your specific HPC system details before using the tool.")
 
 
+def load_hpc_config(path="hpc_config.yaml", copy=True):
+    """
+    Loads the user's HPC configuration file into a dictionary.
+    The file is read in binary mode and parsed with the libyaml C loader when available.
+
+    Parsed files are cached by path and only re-read when their modification time or size changes,
+    so repeated loads in the same process (e.g. the backend and then the frontend, or repeated runs
+    in a notebook) do not re-parse the YAML. A deep copy is returned so callers can modify it freely.
+
+    Args:
+        path (str): Path to the configuration file. Default is 'hpc_config.yaml' in the current working directory.
+        copy (bool): Return a deep copy of the cached configuration (default). Read-only callers (e.g. the terminal output) 
+                     can pass False to receive the cached dictionary itself, which must then not be modified.
+
+    Raises:
+        ValueError: If the file is not valid YAML.
+
+    Returns:
+        dict: Dictionary containing metadata about the HPC cluster.
+    """
+    abs_path = os.path.abspath(path)
+    file_stats = os.stat(abs_path)
+    key = (file_stats.st_mtime_ns, file_stats.st_size)
+
+    # Return the cached configuration if the file has not changed since it was parsed
+    cached = _YAML_CACHE.get(abs_path)
+    if cached is not None and cached[0] == key:
+        _YAML_CACHE.move_to_end(abs_path)
+        return _copy.deepcopy(cached[1]) if copy else cached[1]
+
+    with open(abs_path, 'rb') as file:
+        try: 
+            hpc_config = yaml.load(file, Loader=_YamlLoader)  # Load the YAML file into a dictionary
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error loading {os.path.basename(path)}: {e}")
+
+    # Store in the cache, evicting the least recently used entry if full
+    _YAML_CACHE[abs_path] = (key, hpc_config)
+    _YAML_CACHE.move_to_end(abs_path)
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+
+    return _copy.deepcopy(hpc_config) if copy else hpc_config
+
+
 if __name__ == "__main__":
     generate_config_file()
\ No newline at end of file
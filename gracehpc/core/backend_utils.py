@@ -15,20 +15,66 @@ The module contains the following:
 
 - exit_if_no_jobs (function) - a function to check if the log dataframe is empty or not
 
+- downcast_df (function) - a function to downcast the processed job logs dataframe columns to smaller dtypes to save memory
+
+- aggregate_job_steps (function) - a function to merge the job step rows of the sacct logs into one row per job with sorted numpy reductions
+
+- aggregate_job_steps_polars (function) - the same merge as a Polars lazy query (used when the user selects the 'polars' Engine)
+
+- read_sacct_output (function) - a function to parse sacct's pipe-delimited output, using pyarrow's fast CSV reader when it is installed.
+
+- write_csv (function) - a function to write a dataframe to CSV, using pyarrow's fast CSV writer when it is installed.
+
 - save_output_dfs (function) - a function to save the output dataframes to CSV files based on user arguments.
 
+- get_api_session (function) - a function returning the HTTP session shared by all Carbon Intensity API requests.
+
 - get_carbon_intensity (function) - a function to query the Carbon Intensity API for real-time carbon intensity data at the time of job submission.
 """
 
 # Import libraries
 import pandas as pd
 import numpy as np 
-import datetime
 import sys 
 import os
-import requests 
-from datetime import timedelta
-import pytz
+import re
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum number of concurrent Carbon Intensity API requests (and pooled HTTPS connections)
+API_MAX_WORKERS = 16
+
+### ---- cached constants used by the JobLogUtils methods ---- ###
+_SECONDS_PER_HOUR = 3600.0       # converts the seconds columns to hours
+
+# Seconds columns added alongside the parsed runtime (timedelta) columns, for cheap arithmetic in the hours calculations
+_SECONDS_COLUMNS = {'ElapsedSec': 'ElapsedRuntime', 'ActualCPUtimeSec': 'ActualCPUtime', 'CPUwalltimeSec': 'CPUwalltime'}
+
+# sacct reports Elapsed and CPUTime to the whole second, so these are stored as int64 seconds 
+# (TotalCPU includes milliseconds, so ActualCPUtimeSec stays float)
+_WHOLE_SECONDS_COLUMNS = frozenset({'ElapsedSec', 'CPUwalltimeSec'})
+
+# Memory strings from sacct: a number, an optional unit letter and, for ReqMem, an optional 'n' (per node) or 'c' (per CPU core) suffix
+# (e.g. '4Gn', '100Mc', '8G', '3664861K', '0'). Compiled once at import and shared by the ReqMem and MaxRSS parsing.
+_MEMORY_RE = re.compile(r'^(?P<value>\d+(?:\.\d+)?)(?P<unit>[A-Za-z]?)(?P<scope>[cn]?)$')
+
+# Divisors converting each memory unit to GB: 1 GB = 1000 MB = 1,000,000 KB (no conversion needed for 'G')
+_GB_DIVISORS = {'G': 1.0, 'M': 1e3, 'K': 1e6}
+
+# Common SLURM job states mapped to a standard integer code: 1 = successfully completed, -2 = still active (pending/running/requeued).
+# Any other state is treated as failed (0)
+_STATE_CODES = {state: 1 for state in ('CD', 'COMPLETED')} | {state: -2 for state in ('PD', 'PENDING', 'R', 'RUNNING', 'RQ', 'REQUEUED')}
+
+# Directory for the on-disk cache of carbon intensity values retrieved from the API (one CSV file per region).
+# Follows the XDG base directory convention: $XDG_CACHE_HOME/gracehpc, or ~/.cache/gracehpc if it is not set
+CI_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "gracehpc")
+
+# Only half hours at least this far in the past are cached, as the API's 'forecast' value for recent periods can still be revised
+CI_CACHE_MIN_AGE = pd.Timedelta(days=1)
+
+# In-memory copy of the carbon intensity cache files already loaded in this process (cache file path -> {bucket: carbon intensity}),
+# so repeated runs (e.g. in a notebook) do not re-read the file or re-query buckets retrieved earlier in the session
+_CI_MEMORY_CACHE = {}
 
 
 class JobLogUtils():
@@ -44,103 +90,169 @@ class JobLogUtils():
         """
         self.hpc_config = hpc_config
 
+        # Flat lookup of partition name -> processor category (CPU/GPU), built once from the configuration file
+        self._partition_category = {name: details['processor'] for name, details in (hpc_config.get('partitions') or {}).items()}
+
+
+    def parse_timedelta_series(self, time_strings):
+        """ 
+        Converts a column of SLURM duration strings into timedeltas in a single vectorised pass.
+
+        Each string is normalised to pandas' '<days> days HH:MM:SS[.MS]' form (filling in the days
+        and any missing hour/minute fields with zeros), then parsed with 'pd.to_timedelta'.
+        Missing (empty) or unparsable durations are treated as zero rather than failing the whole column.
+
+        Args:
+            time_strings (pd.Series): time durations in the format '[DD-[HH:]]MM:SS[.MS]'
+
+        Return:
+            pd.Series: timedelta64 series representing the durations (same index as the input)
+        """
+        # Missing durations (empty sacct fields) count as zero
+        time_strings = time_strings.fillna('0')
+
+        # Split the days (DD) from the time if present ('' for the days part when there is no '-')
+        day_split = time_strings.str.rpartition('-')
+        days = day_split[0].where(day_split[0] != '', '0')
+        time_part = day_split[2]
+
+        # Pad missing hours/minutes depending on how many ':' separated fields are present
+        colon_count = time_part.str.count(':')
+        if (colon_count > 2).any():
+            raise ValueError(f"Unable to parse time string: {time_strings[colon_count > 2].iloc[0]}")
+        padding = pd.Series(np.select([colon_count == 1, colon_count == 0], ['00:', '00:00:'], default=''),
+                            index=time_strings.index)
+
+        # convert the normalised strings to timedeltas (anything unparsable is set to zero)
+        return pd.to_timedelta(days + ' days ' + padding + time_part, errors='coerce').fillna(pd.Timedelta(0))
+
 
     def str_to_timedelta(self, time_string):
         """ 
-        Converts a duration string into a 'datetime.timedelta' object. 
+        Converts a duration string into a standard library timedelta object. 
+        Thin wrapper around 'parse_timedelta_series' for single values.
 
         Args:
             time_string (str): time duration in the format '[DD-HH:MM:]SS[.MS]'
 
         Return:
-            datetime.timedelta: Parsed timedelta object representing the duration
+            timedelta: Parsed timedelta object representing the duration (converted from pd.Timedelta with 'to_pytimedelta')
         """
-        # Split the days (DD) from time if present 
-        day_parts = time_string.split('-')
+        return self.parse_timedelta_series(pd.Series([time_string])).iloc[0].to_pytimedelta()
+    
 
-        if len(day_parts) == 2:     # If days are present
-            days = int(day_parts[0])
-            time_part = day_parts[1]
-        else:                       # If days are not present
-            days = 0
-            time_part = time_string
+    def add_seconds_columns(self, logs_df):
+        """ 
+        Adds seconds versions of the runtime columns (ElapsedSec, ActualCPUtimeSec, CPUwalltimeSec) to the dataframe,
+        so the hours calculations are plain numeric arithmetic rather than timedelta arithmetic.
+        ElapsedSec and CPUwalltimeSec are whole int64 seconds, ActualCPUtimeSec is float seconds.
+        Only columns whose timedelta column is present (and that do not exist already) are added.
 
-        # Seperate the milliseconds (ms) if present
-        ms_parts = time_part.split('.')
+        Args:
+            logs_df (pd.DataFrame): job logs dataframe containing the parsed timedelta columns (modified in place)
 
-        if len(ms_parts) == 2:
-            milliseconds = int(ms_parts[1])
-            hms_part = ms_parts[0]
-        else:
-            milliseconds = 0
-            hms_part = time_part
-
-        # Split the hours, minutes, seconds
-        time_components = hms_part.split(':')
-        if len(time_components) == 3:
-            padding = []            # add no zeros 
-        elif len(time_components) == 2: 
-            padding = ['00']        # add zeros to fill in
-        elif len(time_components) == 1:
-            padding = ['00', '00']  # add zeros to fill in
-        else:
-            raise ValueError(f"Unable to parse time string: {time_string}")
-        
-        # store final values
-        hours, minutes, seconds = list(map(int, padding + time_components))
+        Return:
+            pd.DataFrame: the same dataframe, with the seconds columns added
+        """
+        for seconds_column, time_column in _SECONDS_COLUMNS.items():
+            if seconds_column not in logs_df.columns and time_column in logs_df.columns:
+                runtimes = pd.to_timedelta(logs_df[time_column])
+                if seconds_column in _WHOLE_SECONDS_COLUMNS:
+                    logs_df[seconds_column] = runtimes.to_numpy().astype('timedelta64[s]').astype(np.int64)
+                else:
+                    logs_df[seconds_column] = runtimes.dt.total_seconds()
+        return logs_df
+    
+
+    def record_to_frame(self, job_record):
+        """ 
+        Converts a single job record into a one-row dataframe (with the seconds columns added) 
+        so the single-record methods can reuse the column-wise ones.
 
-        # covert the string to datetime.timedelta
-        return datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds, milliseconds=milliseconds)
+        Args:
+            job_record (pd.Series): a single row of the job logs dataframe
+
+        Return:
+            pd.DataFrame: one-row dataframe for the job
+        """
+        return self.add_seconds_columns(pd.DataFrame([job_record]))
     
 
-    def process_partition_field(self, job_record):
+    def process_partition_field_series(self, logs_df):
         """ 
-        This method ensures a job's partition field is returned in a clean format:
+        This method ensures the jobs' partition fields are returned in a clean format (whole column at once):
 
         - If NaNs are present, it returns an empty string.
         - If multiple partitions are listed, it chooses the first one only
         - gives user warning if their job is associated with more than one partition
 
         Args:
-            job_record (pd.Series): a row from the slurm logs dataframe
+            logs_df (pd.DataFrame): the slurm logs dataframe (with the Partition, JobID and ElapsedSec columns)
 
         Return: 
-            str: a single partition name or none (empty string) if missing                   
+            pd.Series: a single partition name for each row, or none (empty string) if missing                   
         """
-        # check if the 'Partition' field is missing (NaN) and return empty string
-        if pd.isnull(job_record.Partition):
-            return ''
-        
-        # Split the comma-seperated partition string into a list if there is multiple.
-        partition_list = job_record.Partition.split(',')
+        # Partition column as strings or categorical (the string methods then only run once per distinct value)
+        partitions = logs_df.Partition
 
         # If the job ran (i.e. has an elapsed time > 0) and multiple partitions are listed,
         # warn the user as only 1 partition should apply to a running job.
-        if (job_record.ElapsedRuntime.total_seconds() > 0) and (len(partition_list) > 1):
+        warn_mask = (logs_df.ElapsedSec > 0) & partitions.str.contains(',', regex=False, na=False)
+        for job in logs_df.loc[warn_mask, ['JobID', 'Partition']].itertuples(index=False):
             print(f"\nPARTITION WARNING: More than one partitions were logged for a job that run: "
-                  f"JobID: {job_record.JobID}. Partitions (first one is used): {job_record.Partition}\n")
+                  f"JobID: {job.JobID}. Partitions (first one is used): {job.Partition}\n")
             
-        # return the first partition from the list 
-        return partition_list[0]
+        # return the first partition from each comma-seperated list (missing partitions become empty strings)
+        return partitions.str.partition(',')[0].fillna('')
     
 
-    def categorise_partition(self, partition_name):
+    def process_partition_field(self, job_record):
+        """ 
+        Returns a single job's partition field in a clean format. Thin wrapper around 'process_partition_field_series'.
+
+        Args:
+            job_record (pd.Series): a row from the slurm logs dataframe
+
+        Return: 
+            str: a single partition name or none (empty string) if missing                   
+        """
+        return self.process_partition_field_series(self.record_to_frame(job_record)).iloc[0]
+    
+
+    def categorise_partition_series(self, partition_names):
         """ 
-        Determines the processor category of a given partition (e.g. CPU or GPU)
+        Determines the processor category (e.g. CPU or GPU) of each partition in a column
         based on the HPC cluster configuration file.
 
+        Args:
+            partition_names (pd.Series): Name of each jobs's partition 
+
+        Raises:
+            ValueError: If a partition is not listed in the configuration file.
+
+        Return:
+            pd.Series: Partition category ('CPU' or 'GPU') for each job
+        """
+        # check the given partitions all exist in the configuration dictionary
+        unknown_partitions = partition_names[~partition_names.isin(self._partition_category.keys())].unique()
+        if len(unknown_partitions) > 0:
+            raise ValueError(f"\n Partition found is not listed in the configuration file: {list(unknown_partitions)}\n")
+        
+        # Look up the category (processor type) of each partition from the configuration file.
+        return partition_names.map(self._partition_category)
+    
+
+    def categorise_partition(self, partition_name):
+        """ 
+        Determines the processor category of a single partition. Thin wrapper around 'categorise_partition_series'.
+
         Args:
             partition_name (str): Name of the jobs's partition 
 
         Return:
             str: Partition category ('CPU' or 'GPU')
         """
-        # check if the given partition exists in the configuration dictionary
-        if partition_name not in self.hpc_config['partitions']:
-            raise ValueError(f"\n Partition found is not listed in the configuration file: {partition_name}\n")
-        
-        # Retrieve and return the category (processor type) of this partition from the configuration file.
-        return self.hpc_config['partitions'][partition_name]['processor']
+        return self.categorise_partition_series(pd.Series([partition_name])).iloc[0]
     
 
     def memory_conversion(self, value, unit_label):
@@ -154,12 +266,16 @@ class JobLogUtils():
                             - M (megabytes)
                             - G (gigabytes)
                             - K (kilobytes)
+
+        Raises:
+            ValueError: If the unit label is not one of 'M', 'G', 'K'.
         
         Return:
             float: Memory value converted to gigabytes
         """
         # Check unit label is one of the expected
-        assert unit_label in ['M', 'G', 'K'], f"Invalid unit '{unit_label}. Expected to be either 'M', 'G', 'K']."
+        if unit_label not in ['M', 'G', 'K']:
+            raise ValueError(f"Invalid unit '{unit_label}'. Expected to be either 'M', 'G', 'K'].")
 
         # If unit is megabytes, divide by 1000
         if unit_label == 'M':
@@ -172,93 +288,178 @@ class JobLogUtils():
         return value
     
 
-    def requested_memory(self, job_record):
+    def memory_conversion_series(self, values, unit_labels):
         """ 
-        Determines the total requested memory for a submitted job (in GB)
+        Column-wise version of 'memory_conversion': converts memory values from the given units 
+        into standard gigabytes (GB) in a single pass.
 
         Args:
-            job_record (pd.Series): A single row of the sacct output (containing job details)
+            values (pd.Series): numeric memory values
+            unit_labels (pd.Series): the unit associated with each value ('M', 'G' or 'K')
+
+        Raises:
+            ValueError: If any unit label is not one of 'M', 'G', 'K'.
+
+        Return:
+            pd.Series: Memory values converted to gigabytes
+        """
+        # Look up the divisor for each unit label (NaN for anything unexpected)
+        divisors = unit_labels.map(_GB_DIVISORS)
+
+        # Check unit labels are all one of the expected
+        invalid_units = divisors.isna()
+        if invalid_units.any():
+            raise ValueError(f"Invalid unit '{unit_labels[invalid_units].iloc[0]}'. Expected to be either 'M', 'G', 'K'].")
+
+        # Divide every value by its unit's divisor in one pass
+        return pd.Series(values.to_numpy(dtype=float) / divisors.to_numpy(dtype=float), index=values.index)
+    
+
+    def parse_memory_series(self, memory_strings):
+        """ 
+        Splits memory strings from sacct (ReqMem e.g. '4Gn', '100Mc', '8G' or MaxRSS e.g. '3664861K', '0') 
+        into their parts with a single regex pass over the column.
+
+        Args:
+            memory_strings (pd.Series): memory strings (without missing values)
+
+        Return:
+            pd.DataFrame: 'value' (float, NaN if the string is unrecognised), 'unit' (unit letter, '' if none) 
+                          and 'scope' ('n' per node, 'c' per CPU core, '' for the whole job) for each string
+        """
+        memory_parts = memory_strings.astype(str).str.extract(_MEMORY_RE)
+        memory_parts['value'] = memory_parts['value'].astype(float)
+        return memory_parts
+    
+
+    def requested_memory_series(self, jobs_df):
+        """ 
+        Determines the total requested memory (in GB) for each submitted job, for the whole column at once.
+
+        The ReqMem field can be per node (ending in 'n', multiplied by the number of nodes), per CPU core 
+        (ending in 'c', multiplied by the number of CPUs) or for the whole job (ending in the unit M, G or K).
+
+        Args:
+            jobs_df (pd.DataFrame): sacct output containing the ReqMem, NNodes and NCPUS columns
         
+        Raises:
+            ValueError: If a memory string has an unrecognised format.
+
         Return
-            float: Total memory requested by the user for a job, converted to GB using the method above.
-        """
-        # Extract raw requested memory string, number of nodes and number of CPUs from the job record
-        raw_memory_requested = job_record['ReqMem']
-        total_nodes = job_record['NNodes']
-        total_cpus = job_record['NCPUS']
-
-        # Assign 0GB memory if value is missing
-        if pd.isnull(raw_memory_requested):
-            memory_unit = 'G'
-            total_memory_gb = 0
-
-        # If memory string ends with 'n': memory was requested per node.
-        # Multiply the base memory by number of nodes
-        elif raw_memory_requested[-1] == 'n':
-            memory_unit = raw_memory_requested[-2]  # extract unit
-            total_memory_gb = float(raw_memory_requested[:-2] * total_nodes)
-
-        # If memory string ends with 'c': memory was requested per CPU core
-        # Multiply base memory by number of CPUs
-        elif raw_memory_requested[-1] == 'c':
-            memory_unit = raw_memory_requested[-2]      # extract unit
-            total_memory_gb = float(raw_memory_requested[:-2]) * total_cpus
+            pd.Series: Total memory requested by the user for each job, converted to GB (0 if missing).
+        """
+        # Jobs request memory with a handful of distinct strings (e.g. '4Gn' repeated for every job), so each distinct
+        # string is parsed once and the parsed parts are indexed back onto the rows (missing values have code -1)
+        request_codes, unique_requests = pd.factorize(jobs_df['ReqMem'])
+        raw_memory_requested = pd.Series(unique_requests.astype(str))
+        memory_parts = self.parse_memory_series(raw_memory_requested)
+
+        # Memory requested per node ('n'), per CPU core ('c') or for the whole job (standard unit)
+        per_node = memory_parts['scope'] == 'n'
+        per_cpu = memory_parts['scope'] == 'c'
+        unrecognised = memory_parts['value'].isna() | (memory_parts['unit'] == '')
+        if unrecognised.any():       # raise error if the memory format is unrecognisable
+            raise ValueError(f"Memory format is unrecognised: {raw_memory_requested[unrecognised].iloc[0]}. Cannot read.")
+
+        # The unit and the numeric base memory of each distinct request
+        memory_unit = memory_parts['unit'].to_numpy()
+        base_memory = memory_parts['value'].to_numpy()
+
+        # Index the parsed parts back onto the jobs that requested memory (assign 0GB memory if value is missing)
+        present = request_codes >= 0
+        row_codes = request_codes[present]
+
+        # Multiply the base memory by the number of nodes or CPUs
+        multiplier = np.select([per_node.to_numpy()[row_codes], per_cpu.to_numpy()[row_codes]],
+                               [jobs_df['NNodes'].to_numpy()[present], jobs_df['NCPUS'].to_numpy()[present]], default=1)
         
-        # If the memory string ends with a standard unit, parse directly
-        elif raw_memory_requested[-1] in ['M', 'G', 'K']:
-            memory_unit = raw_memory_requested[-1]      # extract unit (last character)
-            total_memory_gb = float(raw_memory_requested[:-1])
+        # Convert memory to Gigabytes
+        total_memory_gb = pd.Series(0.0, index=jobs_df.index)
+        total_memory_gb[present] = self.memory_conversion_series(pd.Series(base_memory[row_codes] * multiplier),
+                                                                 pd.Series(memory_unit[row_codes])).to_numpy()
+        return total_memory_gb
+    
+
+    def requested_memory(self, job_record):
+        """ 
+        Determines the total requested memory for a single submitted job (in GB).
+        Thin wrapper around 'requested_memory_series'.
 
-        else:       # raise error if the memory format is unrecognisable
-            raise ValueError(f"Memory format is unrecognised: {raw_memory_requested}. Cannot read.")
+        Args:
+            job_record (pd.Series): A single row of the sacct output (containing job details)
         
-        # Convert memory to Gigabytes using method above
-        return self.memory_conversion(total_memory_gb, memory_unit)
+        Return
+            float: Total memory requested by the user for a job, converted to GB.
+        """
+        return self.requested_memory_series(pd.DataFrame([job_record])).iloc[0]
     
 
-    def process_max_rss(self, job_record):
+    def process_max_rss_series(self, max_rss):
         """ 
-        Processes the MaxRSS (max resident set size) memory usage filed from the SLURM logs
-        and converts it to GB.
+        Processes the MaxRSS (max resident set size) memory usage field from the SLURM logs
+        and converts it to GB, for the whole column at once.
         MaxRSS is a runtime memory usage metric (how much RAM your job actually used). 
         Not what the user requested.
 
         Args:
-            job_record (pd.Series): a single job record containing the MaxRSS field
+            max_rss (pd.Series): the MaxRSS column of the sacct logs (strings, NaN if not reported)
         
+        Raises:
+            ValueError: If a MaxRSS value has an unrecognised format.
+
         Return:
-            float: Actual memory used in GB (MaxRSS value in GB), or -1 if not reported
+            pd.Series: Actual memory used in GB (MaxRSS value in GB), or -1 if not reported
         """
-        # If MaxRSS is missing, assume full requested memory was utilised (mark with -1)
-        if pd.isnull(job_record.MaxRSS):
-            memory_used = -1
-        
-        # If MaxRSS is zero, memory usage=0
-        elif job_record.MaxRSS == '0':
-            memory_used = 0
-
-        else:   # check if MaxRSS value is a string
-            assert type(job_record.MaxRSS) == str
+        missing = max_rss.isna()
+        reported = max_rss[~missing]
 
-            # Case 1: MaxRSS ends with a unit character (K,M,G)
-            if job_record.MaxRSS[-1].isalpha():
-                numeric_part = float(job_record.MaxRSS[:-1])    # extract value
-                unit_part = job_record.MaxRSS[-1]               # extract unit
-                memory_used = self.memory_conversion(numeric_part, unit_part)       # convert to GB
+        # Split into the number and the unit character (K,M,G) in one pass (MaxRSS has no per node/CPU suffix)
+        memory_parts = self.parse_memory_series(reported)
+        unrecognised = memory_parts['value'].isna() | (memory_parts['scope'] != '')
+        if unrecognised.any():
+            raise ValueError(f"MaxRSS format is unrecognised: {reported[unrecognised].iloc[0]}. Cannot read.")
 
-            # Case 2: MaxRSS does not include a unit (provide K as default)
-            else:
-                numeric_part = float(job_record.MaxRSS)
-                default_unit = 'K'
-                memory_used = self.memory_conversion(numeric_part, default_unit)
+        # Provide K as the default unit where none is given
+        unit_part = memory_parts['unit'].where(memory_parts['unit'] != '', 'K')
 
+        # convert to GB (a MaxRSS of '0' gives 0 in any unit)
+        memory_used = pd.Series(-1.0, index=max_rss.index)     # missing MaxRSS is marked with -1 (assume full requested memory was utilised)
+        memory_used[~missing] = self.memory_conversion_series(memory_parts['value'], unit_part)
         return memory_used
     
 
+    def process_max_rss(self, job_record):
+        """ 
+        Processes the MaxRSS field of a single job record and converts it to GB.
+        Thin wrapper around 'process_max_rss_series'.
+
+        Args:
+            job_record (pd.Series): a single job record containing the MaxRSS field
+        
+        Return:
+            float: Actual memory used in GB (MaxRSS value in GB), or -1 if not reported
+        """
+        return self.process_max_rss_series(pd.Series([job_record.MaxRSS], dtype=object)).iloc[0]
+    
+
+    def used_memory_series(self, jobs_df):
+        """ 
+        Clarifies the actual memory used by each job (whole column at once).
+        If MaxRSS was not recorded (UsedMemoryGB = -1), it assumes full requested memory was used.
+        
+        Args:
+            jobs_df (pd.DataFrame): job logs dataframe containing requested and used memory fields
+
+        Return:
+            pd.Series: Estimated memory used in GB for each job
+        """
+        # If MaxRSS was not available, use ReqMem
+        return jobs_df.UsedMemoryGB.where(jobs_df.UsedMemoryGB != -1, jobs_df.RequestedMemoryGB)
+
+
     def used_memory(self, job_record):
         """ 
-        Clarifies the actual memory used by a job.
-        If MaxRSS was not recorded, it assumes full requested memory was used.
+        Clarifies the actual memory used by a single job. Thin wrapper around 'used_memory_series'.
         
         Args:
             job_record (pd.Series): a row of job data containing requested and used memory fields
@@ -266,75 +467,169 @@ class JobLogUtils():
         Return:
             float: Estimated memory used in GB
         """
-        # If MaxRSS was not available, use ReqMem
-        if job_record.UsedMemoryGB == -1:
-            return job_record.RequestedMemoryGB
-        else: 
-            return job_record.UsedMemoryGB
+        return self.used_memory_series(pd.DataFrame([job_record])).iloc[0]
         
 
-    def cpu_gpu_core_hours(self, job_record):
+    def cpu_gpu_core_hours_series(self, jobs_df):
         """ 
-        Calculates the the total core-hours charged for a job, separating CPU and GPU usage.
+        Calculates the the total core-hours charged for each job, separating CPU and GPU usage.
         Depending on the partition category (CPU or GPU), the core-hours charged are estimated based 
         on the number of CPU cores used or the number of GPUs allocated and their corresponding runtime.
 
+        Args:
+            jobs_df (pd.DataFrame): the job logs DataFrame
+
+        Return:
+            tuple (pd.Series, pd.Series): (charged CPU hours, charged GPU hours) for each job
+        """
+        is_cpu = jobs_df.PartitionCategory.eq('CPU')
+
+        # CPU partitions are charged CPU walltime (no GPUs), GPU partitions are charged elapsed runtime * GPUs
+        cpu_hours = pd.Series(np.where(is_cpu, jobs_df.CPUwalltimeSec / _SECONDS_PER_HOUR, 0.0), index=jobs_df.index)
+        gpu_hours = pd.Series(np.where(is_cpu, 0.0, jobs_df.ElapsedSec * jobs_df.GPUsAllocated / _SECONDS_PER_HOUR), index=jobs_df.index)
+        return cpu_hours, gpu_hours
+
+
+    def cpu_gpu_core_hours(self, job_record):
+        """ 
+        Calculates the the total core-hours charged for a single job. Thin wrapper around 'cpu_gpu_core_hours_series'.
+
         Args:
             job_record (pd.Series): a single row from the job logs DataFrame
 
         Return:
             tuple (float, float): (charged CPU hours, charged GPU hours)
         """
-        # If partition category (processor type) is 'CPU'
-        if job_record.PartitionCategory == 'CPU':
-            return job_record.CPUwalltime / np.timedelta64(1, 'h'), 0.0       # no GPUs
-        
-        # If partition category (processor type) is 'GPU'
-        else:
-            gpu_hours = (job_record.ElapsedRuntime * job_record.GPUsAllocated) / np.timedelta64(1, 'h')
-            return 0.0, gpu_hours
+        cpu_hours, gpu_hours = self.cpu_gpu_core_hours_series(self.record_to_frame(job_record))
+        return cpu_hours.iloc[0], gpu_hours.iloc[0]
         
 
-    def node_hours(self, job_record):
+    def node_hours_series(self, jobs_df):
         """ 
-        Calculates the total node-hours charged for a job.
+        Calculates the total node-hours charged for each job.
         Node-hours are calculated by multiplying elapsed runtime (wallclock)
         by the number of nodes used.
 
         These are used to calculate scope 3 emissions for Isambard systems
 
+        Args:
+            jobs_df (pd.DataFrame): the job logs DataFrame
+
+        Return:
+            pd.Series: total node-hours charged for each job
+        """
+        return jobs_df.ElapsedSec * jobs_df.TotalNodes / _SECONDS_PER_HOUR
+
+
+    def node_hours(self, job_record):
+        """ 
+        Calculates the total node-hours charged for a single job. Thin wrapper around 'node_hours_series'.
+
         Args:
             job_record (pd.Series): a single row from the job logs DataFrame
 
         Return:
             float: total node-hours charged for a job
         """
-        node_hours = (job_record.ElapsedRuntime * job_record.TotalNodes) / np.timedelta64(1, 'h')
-        return node_hours
+        return self.node_hours_series(self.record_to_frame(job_record)).iloc[0]
+
+
+    def usage_and_hours_series(self, jobs_df):
+        """ 
+        Computes the CPU/GPU usage times and the CPU, GPU and node-hours of every job in one block,
+        sharing the partition category masks and runtime arrays between the five columns
+        (same results as 'CPU_usage_time_series', 'GPU_usage_time_series', 'cpu_gpu_core_hours_series' and 'node_hours_series').
+
+        Args:
+            jobs_df (pd.DataFrame): the job logs DataFrame
+
+        Return:
+            dict: column name -> numpy array for CPUusagetime, GPUusagetime, CPUhours, GPUhours and NodeHours
+        """
+        # Partition category masks and runtime arrays (extracted once)
+        is_cpu = jobs_df.PartitionCategory.eq('CPU').to_numpy()
+        is_gpu = jobs_df.PartitionCategory.eq('GPU').to_numpy()
+        elapsed_sec = jobs_df.ElapsedSec.to_numpy()
+        gpus = jobs_df.GPUsAllocated.to_numpy()
+
+        return {
+            # If no CPU usage time (TotalCPU in sacct) is recorded, assume full usage (100%) for all cores
+            'CPUusagetime': np.where(jobs_df.ActualCPUtimeSec.to_numpy() != 0, jobs_df.ActualCPUtime.to_numpy(), jobs_df.CPUwalltime.to_numpy()),
+            # GPU usage time assuming 100% utilisation, 0 if the job is not run on a GPU partition
+            'GPUusagetime': np.where(is_gpu, jobs_df.ElapsedRuntime.to_numpy() * gpus, np.timedelta64(0, 'ns')),
+            # CPU partitions are charged CPU walltime (no GPUs), GPU partitions are charged elapsed runtime * GPUs
+            'CPUhours': np.where(is_cpu, jobs_df.CPUwalltimeSec.to_numpy() / _SECONDS_PER_HOUR, 0.0),
+            'GPUhours': np.where(is_cpu, 0.0, elapsed_sec * gpus / _SECONDS_PER_HOUR),
+            # Elapsed runtime (wallclock) * number of nodes used
+            'NodeHours': elapsed_sec * jobs_df.TotalNodes.to_numpy() / _SECONDS_PER_HOUR,
+        }
 
     
+    def extract_jobID_series(self, job_ids):
+        """ 
+        Extracts the main job IDs from array jobs (whole column at once)
+
+        Args:
+            job_ids (pd.Series): Full slurm job IDs possibly including a task index
+
+        Raises:
+            ValueError: If any Job ID contains more than one '_'.
+        
+        Return:
+            pd.Series: Main Job IDs without array task suffix 
+        """
+        # Split each ID on '_' once, reusing the parts for both the format check and the main ID
+        id_parts = job_ids.str.split('_')
+
+        # check the format is correct (should not be more than 2 parts)
+        unexpected_format = id_parts.str.len() > 2
+        if unexpected_format.any():
+            raise ValueError(f"Unexpected Job ID format: {job_ids[unexpected_format].iloc[0]}")
+        
+        # Return main/parent Job IDs
+        return id_parts.str[0]
+
+
     def extract_jobID(self, jobID):
         """ 
-        Extracts the main job ID from array jobs
+        Extracts the main job ID from a single (array) job ID. Thin wrapper around 'extract_jobID_series'.
 
         Args:
             JobID (str): Full slurm job ID possibly including a task index
+
+        Raises:
+            ValueError: If the Job ID contains more than one '_'.
         
         Return:
             str: Main Job ID without array task suffix 
         """
-        parts = jobID.split('_')
-        
-        # check the format is correct (should not be more than 2 parts)
-        assert len(parts) <=2, f"Unexpected Job ID format: {jobID}"
-        
-        # Return main/parent Job ID
-        return parts[0]
+        return self.extract_jobID_series(pd.Series([jobID])).iloc[0]
     
 
+    def standardise_states_series(self, job_states):
+        """ 
+        Normalise the jobs' slurm states into standard integer codes (whole column at once)
+
+        Args:
+            job_states (pd.Series): Raw SLURM job state strings from sacct (e.g. 'COMPLETED', 'RUNNING', 'FAILED')
+
+        Return:
+            pd.Series: int8 status codes (1 = success, -2 = job is still running, 0 = other cases are treated as failed)
+        """
+        # Categorical states (as parsed from sacct): look up each distinct state once, then index the
+        # int8 lookup table with the category codes (missing states have code -1, which picks the trailing 0)
+        if isinstance(job_states.dtype, pd.CategoricalDtype):
+            state_codes = job_states.cat.categories.map(_STATE_CODES).fillna(0).to_numpy(dtype=np.int8)
+            return pd.Series(np.append(state_codes, np.int8(0))[job_states.cat.codes.to_numpy()], index=job_states.index)
+
+        # Look up each state in the state code table, any state not listed is treated as failed (0)
+        return job_states.map(_STATE_CODES).fillna(0).astype('int8')
+
+
     def standardise_states(self, job_state):
         """ 
-        Normalise the job's slurm state into a standard integer code
+        Normalise a single job's slurm state into a standard integer code.
+        Thin wrapper around 'standardise_states_series'.
 
         Args:
             job_state (str): Raw SLURM job state string from sacct (e.g. 'COMPLETED', 'RUNNING', 'FAILED')
@@ -342,28 +637,26 @@ class JobLogUtils():
         Return:
             int: Status code (1 = success, -2 = job is still running, 0 = other cases are treated as failed)
         """
-        # Common SLURM job states
-        successful_states = ['CD', 'COMPLETED']
-        acitve_states = ['PD', 'PENDING', 'R', 'RUNNING', 'RQ', 'REQUEUED']
+        return int(self.standardise_states_series(pd.Series([job_state])).iloc[0])
 
-        # For successfully completed jobs
-        if job_state in successful_states:
-            status_code = 1
-        
-        # For failed jobs
-        else: 
-            status_code = 0
 
-        # For running jobs
-        if job_state in acitve_states:
-            status_code = -2
-        
-        return status_code
+    def CPU_usage_time_series(self, jobs_df):
+        """ 
+        Calculates the effective CPU usage time (for total CPUs) for each job
+
+        Args: 
+            jobs_df (pd.DataFrame): the job logs DataFrame
+
+        Return:
+            pd.Series: Total CPU usage time (timedelta) for each job
+        """
+        # If no CPU usage time (TotalCPU in sacct) is recorded, assume full usage (100%) for all cores
+        return jobs_df.ActualCPUtime.where(jobs_df.ActualCPUtimeSec != 0, jobs_df.CPUwalltime)
 
 
     def CPU_usage_time(self, job_record):
         """ 
-        Calculates the effective CPU usage time (for total CPUs) for a job
+        Calculates the effective CPU usage time for a single job. Thin wrapper around 'CPU_usage_time_series'.
 
         Args: 
             job_record (pd.Series): a single row of the job logs DataFrame
@@ -371,43 +664,64 @@ class JobLogUtils():
         Return:
             timedelta: Total CPU usage time
         """
-        # If no CPU usage time (TotalCPU in sacct) is recorded, assume full usage (100%) for all cores
-        if job_record.ActualCPUtime.total_seconds() == 0:
-            return job_record.CPUwalltime 
-        
-        # return CPU usage time if available
-        return job_record.ActualCPUtime
+        return self.CPU_usage_time_series(self.record_to_frame(job_record)).iloc[0]
     
-    def GPU_usage_time(self, job_record):
+    def GPU_usage_time_series(self, jobs_df):
         """ 
-        Calculates the GPU usage time for a job
+        Calculates the GPU usage time for each job
 
         Args:
-            job_record (pd.Series): a single row of the job logs DataFrame
+            jobs_df (pd.DataFrame): the job logs DataFrame
 
         Return:
-            timedelta: Total GPU usage time 
+            pd.Series: Total GPU usage time (timedelta) for each job
 
         Notes:
         Due to lack of available data from sacct on GPU usage time, we assume 100% GPU utilization.
         If the job is not run on GPU partition, 0 is returned.
         """
-        # Return 0 if job is not run on a GPU partition 
-        if job_record.PartitionCategory != 'GPU':
-            return datetime.timedelta(0)
-        
-        # If job elapsed runtime is positive, carry on.
-        if job_record.ElapsedRuntime.total_seconds() > 0:
-            pass
+        # Calculate Total GPU usage time (assuming 100% utilisation), 0 if the job is not run on a GPU partition 
+        gpu_usage_time = jobs_df.ElapsedRuntime * jobs_df.GPUsAllocated
+        return gpu_usage_time.where(jobs_df.PartitionCategory == 'GPU', pd.Timedelta(0))
+
+
+    def GPU_usage_time(self, job_record):
+        """ 
+        Calculates the GPU usage time for a single job. Thin wrapper around 'GPU_usage_time_series'.
+
+        Args:
+            job_record (pd.Series): a single row of the job logs DataFrame
 
-        # Calculate Total GPU usage time (assuming 100% utilisation)
-        gpu_usage_time = job_record.ElapsedRuntime * job_record.GPUsAllocated
-        return gpu_usage_time
+        Return:
+            timedelta: Total GPU usage time 
+        """
+        return self.GPU_usage_time_series(pd.DataFrame([job_record])).iloc[0]
     
 
+    def min_memory_required_series(self, requested_gb, used_gb):
+        """ 
+        Calculate the minimum amount of memory (GB) required to run each job
+
+        Args:
+            requested_gb (pd.Series): memory requested by each job (GB)
+            used_gb (pd.Series): memory used by each job (GB)
+        
+        Return:
+            pd.Series: Min memory required for each job (GB)
+        """
+        # Round used memory up to the next whole GB (at least 1 GB)
+        rounded_memory = np.maximum(np.ceil(used_gb), 1.0)
+
+        # If requested memory is smaller than actual used memory, the rounded used memory is required.
+        # Otherwise return the smaller of the two
+        return pd.Series(np.where(requested_gb < used_gb, rounded_memory, np.minimum(requested_gb, rounded_memory)), 
+                         index=used_gb.index)
+        
+
     def min_memory_required(self, job_record):
         """ 
-        Calculate the minimum amount of memory (GB) required to run the job
+        Calculate the minimum amount of memory (GB) required to run a single job.
+        Thin wrapper around 'min_memory_required_series'.
 
         Args:
             job_record (pd.Series): a single row of the job logs dataframe
@@ -415,35 +729,37 @@ class JobLogUtils():
         Return:
             Min memory required for the job (GB)
         """
-        # Round memory to the next GB
-        rounded_memory = int(job_record.UsedMemoryGB1) + 1
-
-        # If requested memory is smaller than actual used memory
-        if job_record.RequestedMemoryGB < job_record.UsedMemoryGB1:
-            return rounded_memory
-        
-        # Otherwise return the smaller of the two
-        else:
-            return min(job_record.RequestedMemoryGB, rounded_memory)
+        return self.min_memory_required_series(pd.Series([job_record.RequestedMemoryGB]), pd.Series([job_record.UsedMemoryGB1])).iloc[0]
         
 
-    def wasted_memory(self, job_record):
+    def wasted_memory_series(self, jobs_df):
         """ 
-        Etimates how much memory has been overallocated (i.e. wasted memory)
+        Etimates how much memory has been overallocated (i.e. wasted memory) for each job.
         It is calculated as the ratio between requested memory and memory required.
 
+        Args:
+            jobs_df (pd.DataFrame): the job logs dataframe
+
+        Return:
+            pd.Series: ratio of requested memory to required memory for each job
+        """
+        # Ratio of how much extra memory was requested beyond what was used,
+        # or 1 if the memory requested was not enough
+        wasted_ratio = jobs_df.RequestedMemoryGB / jobs_df.RequiredMemoryGB
+        return wasted_ratio.mask(jobs_df.RequestedMemoryGB < jobs_df.RequiredMemoryGB, 1.0)
+
+
+    def wasted_memory(self, job_record):
+        """ 
+        Etimates how much memory has been overallocated for a single job. Thin wrapper around 'wasted_memory_series'.
+
         Args:
             job_record (pd.Series): a single row of job logs dataframe
 
         Return:
             float: ratio of requested memory to required memory 
         """
-        # If memory requested was not enough, return 1 
-        if job_record.RequestedMemoryGB < job_record.RequiredMemoryGB:
-            return 1.0
-        else:
-            # Otherwise return how much extra memory was requested beyond what was used
-            return job_record.RequestedMemoryGB / job_record.RequiredMemoryGB
+        return self.wasted_memory_series(pd.DataFrame([job_record])).iloc[0]
         
 
 def exit_if_no_jobs(logs_df, user_arguments):
@@ -480,11 +796,211 @@ def exit_if_no_jobs(logs_df, user_arguments):
 
 
 
+def downcast_df(logs_df):
+    """ 
+    Function to shrink the memory footprint of the processed job logs dataframe by downcasting columns 
+    to smaller dtypes, so the later calculation and aggregation passes touch fewer bytes:
+
+    - Partition name/category (a handful of distinct values) -> 'category'
+    - Node, CPU and GPU counts (small non-negative integers) -> smallest unsigned integer type
+
+    Memory, energy and emissions values are kept as float64: they are summed and shown to the user,
+    and single precision rounding errors would appear in the printed results and saved files.
+
+    Args:
+        logs_df (pd.DataFrame): processed job logs dataframe (modified in place)
+
+    Return:
+        pd.DataFrame: the same dataframe with downcasted columns
+    """
+    # Low-cardinality string columns 
+    for column in ['PartitionName', 'PartitionCategory']:
+        if column in logs_df.columns:
+            logs_df[column] = logs_df[column].astype('category')
+
+    # Small integer counts 
+    count_columns = [column for column in ['TotalNodes', 'CPUsAllocated', 'GPUsAllocated'] if column in logs_df.columns]
+    logs_df[count_columns] = logs_df[count_columns].apply(pd.to_numeric, downcast='unsigned')
+
+    return logs_df
+
+
+def aggregate_job_steps(logs_df, key, aggregations):
+    """ 
+    Function to merge the rows of the sacct logs dataframe that share the same job ID (the job and its steps) into a single row,
+    equivalent to 'logs_df.groupby(key).agg(aggregations)' but computed with numpy instead of pandas' per-group reducers.
+    The rows are sorted by the key so each job's rows are contiguous, then every column is reduced in one pass:
+
+    - 'max' / 'min' -> 'np.fmax.reduceat' / 'np.fmin.reduceat' over the group start positions (NaN/NaT are skipped, like pandas)
+    - 'first' -> the first non-missing value in each group (located with 'np.searchsorted')
+
+    Args:
+        logs_df (pd.DataFrame): sacct logs dataframe (one row per job step)
+        key (str): Column to group the rows by (e.g. 'Job_ID')
+        aggregations (dict): Column name -> 'first', 'max' or 'min'
+
+    Raises:
+        ValueError: If an aggregation is not one of 'first', 'max' or 'min'.
+
+    Return:
+        pd.DataFrame: One row per key (sorted, used as the index) with the aggregated columns
+    """
+    # Sort so that all rows of a job are next to each other (stable, so a job's rows keep their sacct order)
+    sorted_df = logs_df.sort_values(key, kind='stable')
+    keys = sorted_df[key].to_numpy()
+
+    # Position of the first row of each group, and the end (exclusive) of each group
+    if len(keys):
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    else:
+        starts = np.empty(0, dtype=np.intp)
+    ends = np.r_[starts[1:], len(keys)]
+
+    aggregated_columns = {}
+    for column, aggregation in aggregations.items():
+        values = sorted_df[column].to_numpy()
+
+        if aggregation == 'max':
+            aggregated_columns[column] = np.fmax.reduceat(values, starts) if len(starts) else values[:0]
+        elif aggregation == 'min':
+            aggregated_columns[column] = np.fmin.reduceat(values, starts) if len(starts) else values[:0]
+        elif aggregation == 'first':
+            # Next non-missing row at or after each group start (len(values) if there is none)
+            valid_rows = np.append(np.flatnonzero(pd.notna(values)), len(values))
+            first_valid = valid_rows[np.searchsorted(valid_rows, starts)]
+            # Groups with no non-missing value are set to missing (categorical columns stay categorical, as with groupby)
+            aggregated_columns[column] = pd.Series(values[np.minimum(first_valid, len(values) - 1)] if len(values) else values,
+                                                   copy=False).where(first_valid < ends).astype(sorted_df[column].dtype).array
+        else:
+            raise ValueError(f"Unsupported aggregation '{aggregation}' for column '{column}'. Expected 'first', 'max' or 'min'.")
+
+    return pd.DataFrame(aggregated_columns, index=pd.Index(keys[starts], name=key))
+
+
+def aggregate_job_steps_polars(logs_df, key, aggregations):
+    """ 
+    Function to merge the job step rows of the sacct logs into one row per job with a Polars lazy query, 
+    used instead of 'aggregate_job_steps' when the user selects the 'polars' Engine. Only the aggregated columns are 
+    converted, the column reductions run in parallel, and the result is converted back to pandas with the same 
+    columns, index and types as 'aggregate_job_steps'.
+
+    Args:
+        logs_df (pd.DataFrame): sacct logs dataframe (one row per job step)
+        key (str): Column to group the rows by (e.g. 'Job_ID')
+        aggregations (dict): Column name -> 'first', 'max' or 'min'
+
+    Raises:
+        ValueError: If polars (or pyarrow, used for the conversion) is not installed, or an aggregation is not one of 'first', 'max' or 'min'.
+
+    Return:
+        pd.DataFrame: One row per key (sorted, used as the index) with the aggregated columns
+    """
+    try:
+        import polars as pl
+        import pyarrow     # required by polars to convert to and from pandas
+    except ImportError as e:
+        raise ValueError(f"The 'polars' Engine requires the 'polars' and 'pyarrow' packages (pip install polars pyarrow), or use --Engine pandas. Error: {e}")
+
+    # Polars expressions equivalent to the aggregations ('first' skips missing values, as pandas does)
+    expressions = []
+    for column, aggregation in aggregations.items():
+        if aggregation == 'first':
+            expressions.append(pl.col(column).drop_nulls().first())
+        elif aggregation in ('max', 'min'):
+            expressions.append(getattr(pl.col(column), aggregation)())
+        else:
+            raise ValueError(f"Unsupported aggregation '{aggregation}' for column '{column}'. Expected 'first', 'max' or 'min'.")
+
+    # Convert only the columns that are aggregated (NaN becomes null so it is skipped), then group, reduce and sort lazily
+    job_df = (pl.from_pandas(logs_df[[key] + list(aggregations)])
+              .lazy()
+              .group_by(key)
+              .agg(expressions)
+              .sort(key)
+              .collect())
+
+    # Back to pandas at the boundary, with the original column dtypes
+    return job_df.to_pandas().set_index(key).astype(logs_df.dtypes[list(aggregations)].to_dict())
+
+
+# Function to parse the sacct output, using pyarrow's C++ CSV reader when it is installed
+def read_sacct_output(sacct_output, column_dtypes):
+    """
+    Parses sacct's pipe-delimited output (no header line) into a DataFrame. If pyarrow is available its multithreaded 
+    C++ CSV reader is used, which is faster than pandas' C parser for wide string tables, otherwise it falls back to pandas.
+    The column types are the same with either reader (string columns as object, categoricals as 'category').
+
+    Args:
+        sacct_output (io.BufferedReader): sacct's stdout pipe (or any buffered binary stream)
+        column_dtypes (dict): Column name -> 'str', 'int64', 'float64' or 'category', in the order the fields are output
+
+    Return:
+        pd.DataFrame: The parsed sacct output
+    """
+    column_names = list(column_dtypes)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa_csv = None
+
+    # pyarrow rejects an empty input, so empty output (no jobs) always goes through pandas
+    if pa_csv is None or not sacct_output.peek(1):
+        return pd.read_csv(sacct_output, sep="|", header=None, names=column_names, dtype=column_dtypes, engine='c')
+
+    # Arrow types matching the pandas dtypes (dictionary-encoded strings convert to pandas categoricals)
+    arrow_types = {'str': pa.string(), 'int64': pa.int64(), 'float64': pa.float64(), 'category': pa.dictionary(pa.int32(), pa.string())}
+    table = pa_csv.read_csv(sacct_output,
+                            read_options=pa_csv.ReadOptions(column_names=column_names),
+                            parse_options=pa_csv.ParseOptions(delimiter="|"),
+                            convert_options=pa_csv.ConvertOptions(column_types={column: arrow_types[dtype] for column, dtype in column_dtypes.items()},
+                                                                  strings_can_be_null=True))     # empty fields are missing values (as in pandas)
+    return table.to_pandas()
+
+
+# Function to write a dataframe to a CSV file, using pyarrow's C++ CSV writer when it is installed
+def write_csv(df, path):
+    """
+    Writes a DataFrame to a CSV file (without the index). If pyarrow is available its multithreaded C++ writer is used, 
+    which is much faster than 'df.to_csv' for large dataframes, otherwise it falls back to pandas.
+    Both writers leave the header and cells unquoted; the only difference is that Arrow writes whole-number floats 
+    without the trailing '.0' and very small floats in plain decimal notation (e.g. '1' and '0.00001' instead of '1.0' and '1e-05').
+
+    Args:
+        df (pd.DataFrame): DataFrame to save
+        path (str): Path of the CSV file
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        # Arrow quotes every header and string cell by default, pandas only quotes when needed, so turn quoting off
+        # (older pyarrow versions without the 'quoting_header' option raise a TypeError and use pandas instead)
+        write_options = pa_csv.WriteOptions(quoting_style="none", quoting_header="none")
+    except (ImportError, TypeError):
+        df.to_csv(path, index=False)
+        return
+
+    # Arrow writes durations as integer nanoseconds, timestamps with nanosecond precision and booleans in lower case, so write
+    # the timedelta/datetime/bool columns as the same text pandas would (e.g. '2 days 22:18:11', '2025-07-17 15:25:58', 'True')
+    text_columns = df.select_dtypes(include=['timedelta', 'datetime', 'bool']).columns
+    if len(text_columns) > 0:
+        df = df.assign(**{column: df[column].astype(str) for column in text_columns})
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, path, write_options=write_options)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # Column types Arrow cannot convert/write (e.g. mixed object columns) and values that would need quoting
+        # (commas, quotes or line breaks, which raise ArrowInvalid with quoting turned off) fall back to pandas
+        df.to_csv(path, index=False)
+
+
 # Function to save dataframes to csv files based on user arguments 
 def save_output_dfs(arguments, full_df, daily_df, total_df):
     """
     Saves the output DataFrames to CSV files based on the user-specified CSV argument.
     Summary dataframes are versions with reduced columns for easier readability.
+    If the user has chosen the 'parquet' Format, the files are saved as snappy-compressed Parquet instead (requires pyarrow).
     
     Args:
         arguments (argparse.Namespace): User arguments entered in the CLI or script/JN usable function
@@ -493,11 +1009,16 @@ def save_output_dfs(arguments, full_df, daily_df, total_df):
         total_df (pd.DataFrame): Total aggregated DataFrame over all jobs (1 row for all jobs)
     """
     file_to_save = arguments.CSV
+    file_format = getattr(arguments, 'Format', 'csv')     # Namespaces built before the Format option existed default to CSV
 
     # Check if the user has provided a valid option for saving files. Print error if not.
     options = ['no_save', 'full', 'daily', 'total', 'full_summary', 'daily_summary', 'total_summary', 'all']
     if file_to_save not in options:
         raise ValueError(f"Unable to Save files due to an invalid --CSV option: '{file_to_save}'. Must be one of: {', '.join(options)}")
+    
+    # Check the file format is valid 
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f"Unable to Save files due to an invalid --Format option: '{file_format}'. Must be one of: csv, parquet")
 
 
     # Define the columns to keep in each summary DataFrame
@@ -522,9 +1043,15 @@ def save_output_dfs(arguments, full_df, daily_df, total_df):
         'TotalEmissions_gCO2e', 'CarbonIntensity_gCO2e_kwh', 'Cost_GBP', 'driving_miles', 'tree_absorption_months',
         'uk_houses_daily_emissions', 'bris_paris_flights'
     ]
-    # Helper function to save dataframes to CSV files 
+    # Helper function to save dataframes to CSV or Parquet files 
     def save(df, filename):
-        df.to_csv(f"{filename}.csv", index=False)
+        if file_format == 'parquet':
+            try:
+                df.to_parquet(f"{filename}.parquet", compression='snappy', index=False)
+            except ImportError as e:
+                raise ValueError(f"Saving to Parquet requires the 'pyarrow' package (pip install pyarrow), or use --Format csv. Error: {e}")
+        else:
+            write_csv(df, f"{filename}.csv")
 
     if file_to_save == "no_save":     # This is the default argument option, do not save any files
         return 
@@ -555,6 +1082,57 @@ def save_output_dfs(arguments, full_df, daily_df, total_df):
 
 
 
+# Constants for the Carbon Intensity API (defined once at import rather than on every call)
+DATE_FORMAT_API = "%Y-%m-%dT%H:%MZ"
+TIME_WINDOW = pd.Timedelta(minutes=30)  # 30 minutes time window for the API query
+API_MAX_SPAN = pd.Timedelta(days=14)    # longest date range the regional API returns in a single request
+DEFAULT_CI = 124       # Average UK carbon intensity of electricity (gCO2e/kWh) - 2024 - https://www.carbonbrief.org/analysis-uks-electricity-was-cleanest-ever-in-2024/ 
+
+# Map the Region Name provided by the user to the region ID used by the API (read-only)
+REGION_MAP = MappingProxyType({
+    "North Scotland": 1,
+    "South Scotland": 2,
+    "North West England": 3,
+    "North East England": 4,
+    "Yorkshire": 5,
+    "North Wales": 6,
+    "South Wales": 7,
+    "West Midlands": 8,
+    "East Midlands": 9,
+    "East England": 10,
+    "South West England": 11,
+    "South England": 12,
+    "London": 13,
+    "South East England": 14
+})
+
+
+# Session shared by all Carbon Intensity API requests in this process (created on first use by 'get_api_session')
+_API_SESSION = None
+
+
+# Function to get the shared HTTP session for the Carbon Intensity API
+def get_api_session():
+    """
+    Returns the 'requests.Session' shared by all Carbon Intensity API requests, creating it on first use.
+    Its connection pool is sized for API_MAX_WORKERS concurrent requests, and keeping one session for the 
+    whole process lets later calls (e.g. repeated runs in a notebook) reuse the open keep-alive HTTPS connections.
+
+    Return:
+        requests.Session: the shared session
+    """
+    global _API_SESSION
+    if _API_SESSION is None:
+        # 'requests' is only imported when the API is actually queried (it is slow to import and not needed otherwise)
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=API_MAX_WORKERS, pool_maxsize=API_MAX_WORKERS))
+        _API_SESSION = session
+    return _API_SESSION
+
+
 # Function for querying the Carbon Intensity API for realtime carbon intensity data
 def get_carbon_intensity(submission_times, arguments):
     """
@@ -562,6 +1140,12 @@ def get_carbon_intensity(submission_times, arguments):
     and returns the carbon intensity value (gCO2e/kWh) for that time. If the API fails, it falls back 
     to the UK average carbon intensity value (2024).
 
+    Submission times are grouped into 30 minute buckets (the resolution of the API), and the half-hourly values are
+    retrieved with one request per span of up to 14 days (API_MAX_SPAN) using the API's date range endpoint. 
+    The requests are made concurrently (up to API_MAX_WORKERS at a time) over a shared 'requests.Session' ('get_api_session').
+    Values retrieved from the API for half hours more than CI_CACHE_MIN_AGE in the past are cached on disk in CI_CACHE_DIR 
+    (and in memory for the rest of the process), so later runs over overlapping date ranges only query the buckets they have not seen before.
+
     API documentation: https://carbon-intensity.github.io/api-definitions/#get-regional-intensity-from-to-regionid-regionid
 
     Args:
@@ -571,91 +1155,126 @@ def get_carbon_intensity(submission_times, arguments):
     Return:
         pd.Series: Series of carbon intensity values (gCO2e/kWh) corresponding to each job.
     """
-    # Define constants for the API
-    Date_format_api = "%Y-%m-%dT%H:%MZ"
-    time_window = timedelta(minutes=30)  # 30 minutes time window for the API query
-    default_CI = 124       # Average UK carbon intensity of electricity (gCO2e/kWh) - 2024 - https://www.carbonbrief.org/analysis-uks-electricity-was-cleanest-ever-in-2024/ 
-
-    # Map the Region Name provided by the user to the region ID used by the API 
-    region_map = {
-        "North Scotland": 1,
-        "South Scotland": 2,
-        "North West England": 3,
-        "North East England": 4,
-        "Yorkshire": 5,
-        "North Wales": 6,
-        "South Wales": 7,
-        "West Midlands": 8,
-        "East Midlands": 9,
-        "East England": 10,
-        "South West England": 11,
-        "South England": 12,
-        "London": 13,
-        "South East England": 14
-    }
-
     # Extract region name from user arguments and the corresponding region ID
     region_name = arguments.Region
 
     # If the user has not specified a region, use the default UK average carbon intensity for all jobs
     if region_name == "UK_average":
-        return pd.Series([default_CI] * len(submission_times), index=submission_times.index)
+        return pd.Series(DEFAULT_CI, index=submission_times.index)
     
     # Confirm the region name given by the user is valid
-    region_id = region_map.get(region_name)
+    region_id = REGION_MAP.get(region_name)
     if region_id is None:
-        raise ValueError(f"Invalid region name: '{region_name}'. Must be one of:\n{['UK_average'] + list(region_map.keys())}")
+        raise ValueError(f"Invalid region name: '{region_name}'. Must be one of:\n{['UK_average'] + list(REGION_MAP.keys())}")
     
-    # Loop over each job submission time and query the API 
-    carbon_intensity_values = []
-    for DateTime in submission_times:
-        try:
-            # Confirm that the datetime is in UTC and timezone-aware for API compatibility 
-            if DateTime.tzinfo is None:
-                # from_utc = DateTime.tz_localize("Europe/London").tz_convert("UTC")
-                from_utc = DateTime.replace(tzinfo=pytz.UTC)
-            else:
-                # from_utc = DateTime.tz_convert("UTC")
-                from_utc = DateTime.astimezone(pytz.UTC)
-        except Exception as e:
-            print(f"Error converting datetime {DateTime} to UTC: {e}")
-            carbon_intensity_values.append(default_CI)
-            continue
-    
-        to_utc = from_utc + time_window         # the end time is the start time + 30 minutes 
-        from_string = from_utc.strftime(Date_format_api)
-        to_string = to_utc.strftime(Date_format_api)
-
-        # Querying the API (request) for each job
-        url = f"https://api.carbonintensity.org.uk/regional/intensity/{from_string}/{to_string}/regionid/{region_id}"
-        try: 
-            # Make the GET request to the API 
-            api_response = requests.get(url, headers={"Accept": "application/json"}, timeout=10)
-            
-            # raise an error if the request was unsuccessful
-            api_response.raise_for_status()
-
-            # Parse the JSON response as JSON format 
-            json_CI_response = api_response.json()
-
-            # Extract the carbon intensity value (gCO2e/kWh) from the response
-            carbon_intensity = json_CI_response["data"]["data"][0]["intensity"]["forecast"]
-
-            # Append the value to the list
-            carbon_intensity_values.append(carbon_intensity)
-
-        except Exception as e:
-            # If the API request fails, use the default carbon intensity value (UK annual average)
-            print(f"Failed to get carbon intensity for {DateTime} from the API. Using UK average: {default_CI} gCO2e/kWh. Error: {e}")
-            carbon_intensity_values.append(default_CI)
-
-    # Return the carbon intensity values as a pandas Series with the same index as submission_times
-    return pd.Series(carbon_intensity_values, index=submission_times.index)
-            
-
-    
-
-
-
-    
-
+    # Convert all the submission times to UTC in one pass for API compatibility (naive times are assumed to already be UTC)
+    if submission_times.dt.tz is None:
+        submission_times_utc = submission_times.dt.tz_localize('UTC')
+    else:
+        submission_times_utc = submission_times.dt.tz_convert('UTC')
+
+    # Collapse the submission times into 30 minute buckets (the resolution of the API), so jobs submitted 
+    # in the same half hour share a single query
+    bucketed_times = submission_times_utc.dt.floor('30min')
+    unique_buckets = pd.DatetimeIndex(bucketed_times.dropna().unique())     # jobs with no valid submission time (NaT) are not queried
+    bucket_strings = unique_buckets.strftime(DATE_FORMAT_API)     # start of each bucket as used by the API (also the cache key)
+
+    # Load the carbon intensities already retrieved for this region on previous runs (keyed by the bucket start time)
+    cache_path = os.path.join(CI_CACHE_DIR, f"ci_{region_id}.csv")
+    cached_CI = _CI_MEMORY_CACHE.get(cache_path)
+    if cached_CI is None:
+        cached_CI = _CI_MEMORY_CACHE[cache_path] = {}
+        if os.path.exists(cache_path):
+            try:
+                cache_df = pd.read_csv(cache_path, dtype={'bucket': str})
+                cached_CI.update(zip(cache_df['bucket'], cache_df['ci']))
+            except Exception as e:
+                print(f"Could not read the carbon intensity cache ({cache_path}). It will be rebuilt. Error: {e}")
+
+    # Only the buckets that are not in the cache need to be retrieved
+    bucket_carbon_intensity = {}
+    missing_buckets = []
+    for bucket, bucket_string in zip(unique_buckets, bucket_strings):
+        if bucket_string in cached_CI:
+            bucket_carbon_intensity[bucket] = cached_CI[bucket_string]
+        else:
+            missing_buckets.append((bucket, bucket_string))
+
+    if missing_buckets:
+        # Group the uncached buckets into spans so a whole span of half-hourly values is retrieved with a single query: 
+        # span start -> end of its last bucket. Each query also starts half an hour before its span (see 'fetch'), so the 
+        # spans are TIME_WINDOW shorter than API_MAX_SPAN to keep every requested range within the API limit
+        span_width = API_MAX_SPAN - TIME_WINDOW
+        first_day = min(bucket for bucket, _ in missing_buckets).floor('D')
+        span_ranges = {}
+        for bucket, _ in missing_buckets:
+            span_start = first_day + ((bucket - first_day) // span_width) * span_width
+            span_ranges[span_start] = max(span_ranges.get(span_start, bucket), bucket + TIME_WINDOW)
+
+        # Query the API for a span of time, returning a dictionary of half hour start ('from') -> carbon intensity
+        def fetch(span):
+            span_start, span_end = span
+            # start half an hour early so the half hour beginning exactly at the span start is always included
+            from_string = (span_start - TIME_WINDOW).strftime(DATE_FORMAT_API)
+            to_string = span_end.strftime(DATE_FORMAT_API)
+
+            # Querying the API (request) for the span 
+            url = f"https://api.carbonintensity.org.uk/regional/intensity/{from_string}/{to_string}/regionid/{region_id}"
+            try: 
+                # Make the GET request to the API 
+                api_response = session.get(url, headers={"Accept": "application/json"}, timeout=30)
+                
+                # raise an error if the request was unsuccessful
+                api_response.raise_for_status()
+
+                # Parse the JSON response as JSON format 
+                json_CI_response = api_response.json()
+
+                # Extract the carbon intensity value (gCO2e/kWh) of every half hour in the response
+                return {period["from"]: period["intensity"]["forecast"] for period in json_CI_response["data"]["data"]
+                        if period["intensity"]["forecast"] is not None}
+
+            except Exception as e:
+                # If the API request fails, the jobs in this span use the default carbon intensity value (UK annual average)
+                print(f"Failed to get carbon intensity for {from_string} to {to_string} from the API. Using UK average: {DEFAULT_CI} gCO2e/kWh. Error: {e}")
+                return {}
+
+        # Run the queries concurrently over the shared session (so the HTTPS connections are reused between requests and runs)
+        session = get_api_session()
+        with ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as executor:
+            span_results = list(executor.map(fetch, span_ranges.items()))
+
+        retrieved_CI = {}
+        for span_values in span_results:
+            retrieved_CI.update(span_values)
+
+        # Add the retrieved values older than CI_CACHE_MIN_AGE to the cache (recent forecasts and buckets the API 
+        # did not return are not cached, so they are retried next run). The fixed-width API time strings compare in time order
+        cache_cutoff = (pd.Timestamp.now(tz='UTC') - CI_CACHE_MIN_AGE).strftime(DATE_FORMAT_API)
+        new_values = {period: ci for period, ci in retrieved_CI.items() if period < cache_cutoff}
+        cached_CI.update(new_values)
+
+        # Look up the carbon intensity of each uncached bucket, falling back to the UK average if it was not returned
+        not_returned = 0
+        for bucket, bucket_string in missing_buckets:
+            bucket_carbon_intensity[bucket] = retrieved_CI.get(bucket_string, DEFAULT_CI)
+            not_returned += bucket_string not in retrieved_CI
+        if not_returned:
+            print(f"No carbon intensity available from the API for {not_returned} half hour period(s). Using UK average: {DEFAULT_CI} gCO2e/kWh for these jobs.")
+
+        # Save the updated cache (best effort: a read-only home directory should not stop the run)
+        if new_values:
+            try:
+                os.makedirs(CI_CACHE_DIR, exist_ok=True)
+                pd.DataFrame({'bucket': list(cached_CI.keys()), 'ci': list(cached_CI.values())}).to_csv(cache_path, index=False)
+            except OSError:
+                pass
+
+    # Map the carbon intensity of each bucket back onto the jobs (same index as submission_times).
+    # Jobs with no valid submission time use the default carbon intensity value (UK annual average)
+    carbon_intensity = bucketed_times.map(bucket_carbon_intensity)
+    missing_times = int(bucketed_times.isna().sum())
+    if missing_times:
+        print(f"{missing_times} job(s) have no valid submission time. Using UK average: {DEFAULT_CI} gCO2e/kWh for these jobs.")
+        carbon_intensity = carbon_intensity.fillna(DEFAULT_CI)
+    return carbon_intensity
@@ -16,16 +16,22 @@ Steps:
 4. Aggregates the data into final dataframes which can be saved to CSV files later if specified by the user in the arguments.
 """
 # Import libraries
-import yaml 
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os 
-import requests
 
 # Import functions/classes from other modules
-from .backend_utils import exit_if_no_jobs, save_output_dfs, get_carbon_intensity
+from .backend_utils import exit_if_no_jobs, save_output_dfs, get_carbon_intensity, DEFAULT_CI
 from .job_log_manager import JobLogProcessor
+from ..config import load_hpc_config
+
+# Helper float hours columns added alongside the usage time (timedelta) columns while the energy is estimated: hours column -> timedelta column
+_HOURS_COLUMNS = {'_cpu_h': 'CPUusagetime', '_gpu_h': 'GPUusagetime', '_elapsed_h': 'ElapsedRuntime'}
+_HOURS_PER_SECOND = 1 / 3600
+
+# Scope 3 emissions factors of the predefined HPC systems (gCO2e/node-hour) - see 'EnergyEmissionsCalculator.scope3_emissions'
+SCOPE3_FACTORS = {'Isambard3': 43.0, 'IsambardAI': 114.0, 'Archer2': 23.0}
 
 # Class to estimate energy consumption, scope 2 (operational emissions) and scope 3 (embodied emissions)
 class EnergyEmissionsCalculator():
@@ -46,98 +52,140 @@ class EnergyEmissionsCalculator():
         # Store constants 
         self.power_gb_mem = 0.3725 # Power consumption per GB of memory (W/GB) - estimated average from the literature
 
+        # TDP values of each partition from the configuration file (indexed by partition name), depending on the partition category (CPU or GPU).
+        # CPU-only partitions: CPU TDP = 'TDP' with no GPU power. GPU partitions: CPU TDP = 'CPU_TDP' and GPU TDP = 'TDP'
+        partitions = hpc_config.get('partitions') or {}
+        for name, details in partitions.items():
+            if details['processor'] != 'CPU' and 'CPU_TDP' not in details:
+                raise ValueError(f"GPU partition '{name}' in hpc_config.yaml has no 'CPU_TDP' value. Please add the TDP per core of its supporting CPUs.")
+        self._cpu_tdp = pd.Series({name: details['TDP'] if details['processor'] == 'CPU' else details['CPU_TDP'] for name, details in partitions.items()}, dtype=float)
+        self._gpu_tdp = pd.Series({name: 0 if details['processor'] == 'CPU' else details['TDP'] for name, details in partitions.items()}, dtype=float)
 
-    def estimate_energy(self, job_record):
-        """ 
-        Estimate the energy consumption for a single job (1 row) based on 
-        sacct usage data. (Not using energy plugins such as IPMI))
+        # Resolve the scope 3 emissions factor (gCO2e/node-hour) from the user argument once for the run (None if no scope 3 emissions are requested)
+        self._scope3_per_nodeh = self.scope3_factor(arguments.Scope3)
+
+
+    def scope3_factor(self, scope3_argument):
+        """
+        Determine the per node-hour scope 3 emissions factor from the 'Scope3' user argument: 
+        one of the predefined systems in SCOPE3_FACTORS, a custom number, or 'no_scope3'.
 
         Args:
-            job_record (pd.Series): a single row (1 job) containing the processed usage data from sacct.
+            scope3_argument (str): the 'Scope3' user argument
+
+        Raises:
+            ValueError: If the argument is not a predefined option or a valid number.
 
         Returns:
-            pd.Series: The input with energy estimates appended as new columns.
+            float or None: scope 3 emissions factor in gCO2e/node-hour, or None for 'no_scope3'.
         """
-        # Extract the partition information from the configuration file 
-        data_partition = self.hpc_config['partitions'][job_record.PartitionName]
-
-        # Determine the TDP values depending on the partition category (CPU or GPU)
-        if job_record.PartitionCategory == 'CPU':           # CPU-only partitions 
-            cpu_tdp = data_partition['TDP'] # CPU TDP from the configuration file 
-            gpu_tdp = 0                     # No GPU power for CPU-only partitions
-
-        else:           # GPU partitions
-            cpu_tdp = data_partition['CPU_TDP']    # CPU TDP for GPU partitions
-            gpu_tdp = data_partition['TDP']         # GPU TDP from the configuration file
-
-        # Calculate CPU energy from usage data, then convert to kWh (time (h) * power draw (W))
-        job_record['CPU_energy_estimated_kwh'] = job_record.CPUusagetime.total_seconds() / 3600 * cpu_tdp / 1000 
-
-        # Calculate GPU energy from usage data, then convert to kWh in the same way
-        job_record['GPU_energy_estimated_kwh'] = job_record.GPUusagetime.total_seconds() / 3600 * gpu_tdp / 1000
-
-        # Calculate the memory energy for requested memory then convert to kWh
-        job_record['memory_energy_estimated_kwh'] = job_record.ElapsedRuntime.total_seconds() / 3600 * job_record.RequestedMemoryGB * self.power_gb_mem / 1000
-
-        # Sum components and multiply by the PUE (DC overhead) to get total energy consumption estimate (kWh)
-        job_record['energy_estimated_kwh'] = (
-            job_record.CPU_energy_estimated_kwh + 
-            job_record.GPU_energy_estimated_kwh + 
-            job_record.memory_energy_estimated_kwh
-        ) * self.hpc_config['PUE']
-
-        # Do the same without the PUE for energy plugin comparison
-        job_record['energy_estimated_noPUE_kwh'] = (
-            job_record.CPU_energy_estimated_kwh + 
-            job_record.GPU_energy_estimated_kwh + 
-            job_record.memory_energy_estimated_kwh)
+        if scope3_argument == "no_scope3":          # This is the default argument 
+            return None
         
-        # Calculate the memory energy for required memory 
-        job_record['required_memory_energy_estimated_kwh'] = job_record.ElapsedRuntime.total_seconds() / 3600 * job_record.RequiredMemoryGB * self.power_gb_mem / 1000
-
-        # total energy using the required memory
-        job_record['energy_requiredMem_estimated_kwh'] = (
-            job_record.CPU_energy_estimated_kwh + 
-            job_record.GPU_energy_estimated_kwh + 
-            job_record.required_memory_energy_estimated_kwh
-        ) * self.hpc_config['PUE']
+        # Predefined systems 
+        if scope3_argument in SCOPE3_FACTORS:
+            return SCOPE3_FACTORS[scope3_argument]
+        
+        # If the user has specified a custom scope 3 (number) or incorrect argument
+        try:
+            return float(scope3_argument)       # Convert custom emissions factor to float
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid Scope3 argument: {scope3_argument}. Please enter a valid number or one of the predefined options: 'Isambard3', 'IsambardAI', 'Archer2' or 'no_scope3'.")
 
-        return job_record
-    
 
-    def scope2_emissions(self, df_jobs, energy_column, carbon_intensity_values):
+    def add_hours_columns(self, df_jobs):
         """
-        Compute the scope 2 (operational) carbon emissions for each job in a dataframe 
-        based on the given energy column (kWh) and realtime grid carbon intensity data.
+        Adds float hours columns ('_cpu_h', '_gpu_h', '_elapsed_h') for the usage time (timedelta) columns in one pass, 
+        so the energy estimates read hours directly instead of converting the timedeltas again.
+        Only columns that do not exist already are added.
 
         Args:
-            df_jobs (pd.DataFrame): Full dataframe containing job data with energy columns and submission times.
-            energy_column (str): The name of the column containing energy consumption data in kWh (estimated by usage data or measured by energy counters).
-            carbon_intensity_values (pd.Series): A pandas series containing carbon intensity values (gCO2e/kWh) for each job's submission time from the web API.
+            df_jobs (pd.DataFrame): processed usage data from sacct (modified in place)
 
-        Returns: 
-            pd.Series: a pandas series containing scope 2 emissions estimates for each job (gCO2e) calculated from the specified energy column.
+        Returns:
+            pd.DataFrame: the same dataframe with the hours columns added
         """
+        for hours_column, time_column in _HOURS_COLUMNS.items():
+            if hours_column not in df_jobs.columns:
+                df_jobs[hours_column] = df_jobs[time_column].dt.total_seconds().to_numpy() * _HOURS_PER_SECOND
+        return df_jobs
+
+
+    def estimate_energy_series(self, df_jobs):
+        """ 
+        Estimate the energy consumption of every job in a dataframe in a single vectorised pass, based on 
+        sacct usage data. (Not using energy plugins such as IPMI))
 
-        # Check if energy column is from energy counters or estimated from usage data 
-        if energy_column == 'EnergyIPMI_kwh':
-            # Confirm if HPC system has working energy counters by checking if any value in the IPMI column is greater than 0
-            if (df_jobs[energy_column] > 0).any():
-                # Apply data centre overheads (PUE) 
-                energy_consumption = df_jobs[energy_column] * self.hpc_config['PUE']
-            else:
-                # If all values are 0, skip PUE adjustment
-                energy_consumption = df_jobs[energy_column]
-           
-        else:   
-            # If column is not from energy counters 
-            energy_consumption = df_jobs[energy_column]      
+        The TDP values of each partition (looked up once from the configuration file in __init__) are mapped onto the 
+        jobs by 'PartitionName', then the energy components are calculated as whole-column arithmetic.
 
-        # calculate and return scope 2 emissions for each job = energy (kWh) * carbon intensity (gCO2e/kWh)
-        return energy_consumption * carbon_intensity_values
+        Args:
+            df_jobs (pd.DataFrame): processed usage data from sacct (one row per job), including the hours columns from 'add_hours_columns'.
 
+        Returns:
+            pd.DataFrame: The input with energy estimates appended as new columns.
+        """
+        # Map the TDP values of each partition onto the jobs (as plain float arrays)
+        cpu_tdp = df_jobs['PartitionName'].map(self._cpu_tdp).to_numpy(dtype=float)
+        gpu_tdp = df_jobs['PartitionName'].map(self._gpu_tdp).to_numpy(dtype=float)
+
+        # Usage times in hours 
+        cpu_hours = df_jobs['_cpu_h'].to_numpy()
+        gpu_hours = df_jobs['_gpu_h'].to_numpy()
+        elapsed_hours = df_jobs['_elapsed_h'].to_numpy()
+
+        # The energy arithmetic below updates arrays in place so each step is one pass without allocating new temporaries, 
+        # keeping the same order of operations as the per-job formulas
+
+        # Calculate CPU and GPU energy from usage data, then convert to kWh (time (h) * power draw (W))
+        cpu_energy = cpu_hours * cpu_tdp
+        cpu_energy /= 1000 
+        gpu_energy = gpu_hours * gpu_tdp
+        gpu_energy /= 1000
+
+        # Calculate the memory energy for requested memory and required memory, then convert to kWh
+        memory_energy = elapsed_hours * df_jobs['RequestedMemoryGB'].to_numpy(dtype=float)
+        memory_energy *= self.power_gb_mem
+        memory_energy /= 1000
+        required_memory_energy = elapsed_hours * df_jobs['RequiredMemoryGB'].to_numpy(dtype=float)
+        required_memory_energy *= self.power_gb_mem
+        required_memory_energy /= 1000
+
+        # Processor (CPU + GPU) energy, shared by both totals
+        processor_energy = cpu_energy + gpu_energy
+
+        # Sum components (without the PUE for energy plugin comparison)
+        energy_noPUE = processor_energy + memory_energy
+
+        # Total energy using the required memory (reusing the processor energy array), multiplied by the PUE
+        energy_requiredMem = np.add(processor_energy, required_memory_energy, out=processor_energy)
+        energy_requiredMem *= self.hpc_config['PUE']
+
+        # Add all the energy columns in one step
+        return df_jobs.assign(
+            CPU_energy_estimated_kwh=cpu_energy,
+            GPU_energy_estimated_kwh=gpu_energy,
+            memory_energy_estimated_kwh=memory_energy,
+            energy_estimated_kwh=energy_noPUE * self.hpc_config['PUE'],     # multiply by the PUE (DC overhead) to get total energy consumption estimate (kWh)
+            energy_estimated_noPUE_kwh=energy_noPUE,
+            required_memory_energy_estimated_kwh=required_memory_energy,
+            energy_requiredMem_estimated_kwh=energy_requiredMem)
 
 
+    def estimate_energy(self, job_record):
+        """ 
+        Estimate the energy consumption for a single job (1 row) based on 
+        sacct usage data. Thin wrapper around 'estimate_energy_series'.
+
+        Args:
+            job_record (pd.Series): a single row (1 job) containing the processed usage data from sacct.
+
+        Returns:
+            pd.Series: The input with energy estimates appended as new columns.
+        """
+        job_energy = self.estimate_energy_series(self.add_hours_columns(pd.DataFrame([job_record])))
+        return job_energy.drop(columns=list(_HOURS_COLUMNS)).iloc[0]
+    
 
     def scope3_emissions(self, df_jobs):
         """
@@ -163,29 +211,12 @@ class EnergyEmissionsCalculator():
         Returns:
             pd.Series: a pandas series containing scope 3 emissions estimates for each job (gCO2e) 
         """
-        # Store user argument
-        scope3_argument = self.arguments.Scope3
-
-        if scope3_argument == "no_scope3":          # This is the default argument 
+        if self._scope3_per_nodeh is None:          # 'no_scope3' (the default argument)
             # If no scope 3 emissions are requested, return a series of zeros
-            return pd.Series([0.0] * len(df_jobs), index=df_jobs.index)
-        
-        # Determine the scope 3 emissions factor based on the user argument
-        if scope3_argument == "Isambard3":
-            scope3_per_nodeh = 43.0     # gCO2e/node-hour
-        elif scope3_argument == "IsambardAI":
-            scope3_per_nodeh = 114.0    # gCO2e/node-hour
-        elif scope3_argument == "Archer2":
-            scope3_per_nodeh = 23.0    # gCO2e/node-hour
-        else:       # If the user has specified a custom scope 3 (number) or incorrect argument
-            try:
-                scope3_per_nodeh = float(scope3_argument)       # Convert custom emissions factor to float
-            
-            except (TypeError, ValueError):
-                raise ValueError(f"Invalid Scope3 argument: {scope3_argument}. Please enter a valid number or one of the predefined options: 'Isambard3', 'IsambardAI', 'Archer2' or 'no_scope3'.")
+            return pd.Series(0.0, index=df_jobs.index)
             
         # Calculate scope 3 emissions for each job (node-hours * scope 3 emissions per node-hour)
-        return df_jobs['NodeHours'] * scope3_per_nodeh
+        return pd.Series(df_jobs['NodeHours'].to_numpy() * self._scope3_per_nodeh, index=df_jobs.index)
 
 
 
@@ -221,9 +252,10 @@ def get_job_logs(arguments, hpc_config):
     # Ensure the processed (aggregated) dataframe is also not empty
     exit_if_no_jobs(JLP.filtered_df, arguments)
 
-    # Verify that the final df only contains logs from a single user
-    if len(set(JLP.final_df.UserName)) > 1:
-        raise ValueError(f"Multiple users found in the job logs: {set(JLP.final_df.UserName)}. Please ensure you are only processing logs for a single user.")
+    # Verify that the final df only contains logs from a single user (every username equal to the first one, in one vectorised comparison)
+    user_names = JLP.final_df['UserName'].to_numpy()
+    if not (user_names == user_names[0]).all():
+        raise ValueError(f"Multiple users found in the job logs: {set(user_names)}. Please ensure you are only processing logs for a single user.")
     
     # Return the final processed/filtered dataframe
     return JLP.final_df
@@ -241,49 +273,92 @@ def add_emissions_data (df_jobs, emissions_calculator, hpc_config):
         emissions_calculator (Class): The EnergyEmissionsCalculator class instance for calculating energy and emissions.
 
     Returns:
-        pd.DataFrame: The same input dataframe with additional columns for energy consumption, scope 2, scope 3 emissions and
-        contextual equivalent metrics.
+        pd.DataFrame: A copy of the input dataframe (the input is not modified) with additional columns for energy consumption, 
+        scope 2, scope 3 emissions and contextual equivalent metrics.
     """
-    # Calculate energy consumption estimates from usage data (not energy counters)
-    df_jobs = df_jobs.apply(emissions_calculator.estimate_energy, axis=1)
-
-    # Filter on failed jobs (State code = 0) to see the wasted energy and emissions
-    df_jobs['failed_energy_kwh'] = np.where(df_jobs['StateCode'] == 0, df_jobs.energy_estimated_kwh, 0)
-
-    # Get the carbon intensity value at the submission time of each job from the web API - depends on the 'Region' argument given by the user
-    carbon_intensity_values = get_carbon_intensity(df_jobs['SubmissionTime'], emissions_calculator.arguments)
-
-    # Store carbon intensity values in the dataframe
-    df_jobs['CarbonIntensity_gCO2e_kwh'] = carbon_intensity_values
+    # Work on a shallow copy so the dtype casts, the hours helper columns and the other new columns are not applied to the caller's dataframe
+    df_jobs = df_jobs.copy(deep=False)
+
+    # Partition columns as 'category' dtype so the TDP lookups and groupings work on integer codes 
+    # (already the case for frames from JobLogProcessor, where astype is a no-op)
+    df_jobs['PartitionName'] = df_jobs['PartitionName'].astype('category')
+    df_jobs['PartitionCategory'] = df_jobs['PartitionCategory'].astype('category')
+
+    # Convert the usage times to hours once, then calculate energy consumption estimates from usage data (not energy counters)
+    emissions_calculator.add_hours_columns(df_jobs)
+    df_jobs = emissions_calculator.estimate_energy_series(df_jobs)
+    df_jobs.drop(columns=list(_HOURS_COLUMNS), inplace=True)    # the hours columns are only needed for the estimates
+
+    # Columns read several times below, taken out as arrays once
+    estimated_energy = df_jobs['energy_estimated_kwh'].to_numpy()
+    state_codes = df_jobs['StateCode'].to_numpy()
+    ipmi_energy = df_jobs['EnergyIPMI_kwh'].to_numpy(dtype=float)
+    ipmi_positive = ipmi_energy > 0         # jobs with a reading from the energy counters
+
+    # Filter on failed jobs (State code = 0) to see the wasted energy and emissions 
+    # (multiplying by the 0/1 failed mask rather than selecting with np.where)
+    failed_energy = estimated_energy * (state_codes == 0).view(np.int8)
+    df_jobs['failed_energy_kwh'] = failed_energy
+
+    # Get the carbon intensity value at the submission time of each job from the web API - depends on the 'Region' argument given by the user.
+    # The API has a 30 minute resolution, so only the unique half hours are looked up and the values are broadcast back to the jobs
+    submission_buckets = df_jobs['SubmissionTime'].dt.floor('30min')
+    unique_buckets = submission_buckets.dropna().drop_duplicates()
+    bucket_CI = get_carbon_intensity(unique_buckets, emissions_calculator.arguments)
+    carbon_intensity_values = pd.Series(submission_buckets.map(pd.Series(bucket_CI.to_numpy(), index=unique_buckets.to_numpy())).to_numpy(), 
+                                        index=df_jobs.index)
+
+    # Jobs with no valid submission time (NaT) are not looked up and use the default carbon intensity value (UK annual average).
+    # They are counted here rather than in 'get_carbon_intensity', which is only given the unique half hours
+    missing_times = int(submission_buckets.isna().sum())
+    if missing_times:
+        if emissions_calculator.arguments.Region != "UK_average":
+            print(f"{missing_times} job(s) have no valid submission time. Using UK average: {DEFAULT_CI} gCO2e/kWh for these jobs.")
+        carbon_intensity_values = carbon_intensity_values.fillna(DEFAULT_CI)
+
+    # Store carbon intensity values in the dataframe. The API values (and the UK average) are whole numbers of gCO2e/kWh, 
+    # so they are stored in the smallest integer type that holds them exactly (non-integer values stay float64)
+    df_jobs['CarbonIntensity_gCO2e_kwh'] = pd.to_numeric(carbon_intensity_values, downcast='integer')
+
+    # Scope 2 emissions for each job = energy (kWh) * carbon intensity (gCO2e/kWh)
+    carbon_intensity = carbon_intensity_values.to_numpy(dtype=float)
+
+    # Energy from counters: apply data centre overheads (PUE) only if the HPC system has working energy counters 
+    # (any value in the IPMI column greater than 0), otherwise all values are 0 and the PUE adjustment is skipped
+    ipmi_energy_PUE = ipmi_energy * hpc_config['PUE'] if ipmi_positive.any() else ipmi_energy
 
     # Calculate carbon emissions using full memory (requested)
-    df_jobs['Scope2Emissions_gCO2e'] = emissions_calculator.scope2_emissions(df_jobs, 'energy_estimated_kwh', carbon_intensity_values)        # Scope 2 carbon emissions estimated using usage data
-    df_jobs['Scope2Emissions_IPMI_gCO2e'] = emissions_calculator.scope2_emissions(df_jobs, 'EnergyIPMI_kwh', carbon_intensity_values)      # Scope 2 carbon emissions estimated using energy counters (if available)
-    df_jobs['Scope3Emissions_gCO2e'] = emissions_calculator.scope3_emissions(df_jobs)       # Scope 3 carbon emissions
+    scope2_emissions = estimated_energy * carbon_intensity
+    scope2_emissions_ipmi = ipmi_energy_PUE * carbon_intensity
+    scope3_emissions = emissions_calculator.scope3_emissions(df_jobs).to_numpy()
+    df_jobs['Scope2Emissions_gCO2e'] = scope2_emissions        # Scope 2 carbon emissions estimated using usage data
+    df_jobs['Scope2Emissions_IPMI_gCO2e'] = scope2_emissions_ipmi      # Scope 2 carbon emissions estimated using energy counters (if available)
+    df_jobs['Scope3Emissions_gCO2e'] = scope3_emissions       # Scope 3 carbon emissions
 
     # Calculate scope 2 carbon emissions using required memory only to assess wasted memory
-    df_jobs['Scope2Emissions_requiredMem_gCO2e'] = emissions_calculator.scope2_emissions(df_jobs, 'energy_requiredMem_estimated_kwh', carbon_intensity_values)
+    df_jobs['Scope2Emissions_requiredMem_gCO2e'] = df_jobs['energy_requiredMem_estimated_kwh'].to_numpy() * carbon_intensity
 
     # Scope 2 emissions of failed jobs
-    df_jobs['Scope2Emissions_failed_gCO2e'] = emissions_calculator.scope2_emissions(df_jobs, 'failed_energy_kwh', carbon_intensity_values)
+    df_jobs['Scope2Emissions_failed_gCO2e'] = failed_energy * carbon_intensity
 
     # Add cost
     cost_per_kwh = hpc_config.get('electricity_cost', 0.2573) # Default = Average Cost of electricity in the UK (0.2573 GBP/kWh) - July 2025 - https://www.ofgem.gov.uk/information-consumers/energy-advice-households/energy-price-cap
 
     # Use energy from counters if available, otherwise use estimated energy from usage data 
-    if (df_jobs['EnergyIPMI_kwh'] > 0).all():
+    # (every job has a reading from the energy counters)
+    if ipmi_positive.all():
         # Use plugin-energy for cost calculation if available
-        df_jobs['Cost_GBP'] = df_jobs['EnergyIPMI_kwh'] * cost_per_kwh    # cost of electricity in GBP
+        df_jobs['Cost_GBP'] = ipmi_energy * cost_per_kwh    # cost of electricity in GBP
 
         # Total carbon emissions (scope 2 from energy counters + scope 3)
-        df_jobs['TotalEmissions_gCO2e'] = df_jobs['Scope2Emissions_IPMI_gCO2e'] + df_jobs['Scope3Emissions_gCO2e']
+        df_jobs['TotalEmissions_gCO2e'] = scope2_emissions_ipmi + scope3_emissions
 
     else:
         # Otherwise use estimated energy from usage data
-        df_jobs['Cost_GBP'] = df_jobs['energy_estimated_kwh'] * cost_per_kwh
+        df_jobs['Cost_GBP'] = estimated_energy * cost_per_kwh
 
         # Total carbon emissions (scope 2 from usage data + scope 3)
-        df_jobs['TotalEmissions_gCO2e'] = df_jobs['Scope2Emissions_gCO2e'] + df_jobs['Scope3Emissions_gCO2e']
+        df_jobs['TotalEmissions_gCO2e'] = scope2_emissions + scope3_emissions
 
     ### ----------------------------------------------------------------------------------------------
     ### CONTEXTUAL EQUIVALENTS
@@ -298,11 +373,14 @@ def add_emissions_data (df_jobs, emissions_calculator, hpc_config):
     daily_UK_house_emissions = daily_UK_house_energy * average_UK_CI  # gCO2e/day
     bris_paris_flight = 141700    # gCO2e/passenger - estimated emissions for a one-way flight from Bristol to Paris - https://curb6.com/footprint/flights/bristol-brs/paris-cdg
 
-    # Add equivalents to the dataframe
-    df_jobs['driving_miles'] = df_jobs.TotalEmissions_gCO2e / driving_per_miles         # Equivalent miles driven by an average petrol/diesel car in the UK
-    df_jobs['tree_absorption_months'] = df_jobs.TotalEmissions_gCO2e / tree_months_factor  # Equivalent months of carbon absorption by a mature tree
-    df_jobs['uk_houses_daily_emissions'] = df_jobs.TotalEmissions_gCO2e / daily_UK_house_emissions  # Equivalent number of UK households' daily emissions
-    df_jobs['bris_paris_flights'] = df_jobs.TotalEmissions_gCO2e / bris_paris_flight  # Equivalent number of flights from Bristol to Paris
+    # Add equivalents to the dataframe, dividing the total emissions by all four factors in one broadcast (TotalEmissions is read once):
+    # - driving_miles: Equivalent miles driven by an average petrol/diesel car in the UK
+    # - tree_absorption_months: Equivalent months of carbon absorption by a mature tree
+    # - uk_houses_daily_emissions: Equivalent number of UK households' daily emissions
+    # - bris_paris_flights: Equivalent number of flights from Bristol to Paris
+    equivalent_factors = np.array([driving_per_miles, tree_months_factor, daily_UK_house_emissions, bris_paris_flight])
+    equivalents = df_jobs['TotalEmissions_gCO2e'].to_numpy(dtype=float)[:, None] / equivalent_factors
+    df_jobs[['driving_miles', 'tree_absorption_months', 'uk_houses_daily_emissions', 'bris_paris_flights']] = equivalents
 
     return df_jobs
 
@@ -369,43 +447,118 @@ def aggregate_df(df_jobs, arguments):
         'bris_paris_flights': ('bris_paris_flights', 'sum'),  # total equivalent number of flights from Bristol to Paris
     }
 
-    def aggregation(df, group_by_column=None):
+    def add_summary_columns(aggregated_df):
         """
-        Function to aggregate the job dataframe by the specified column.
+        Function to add the extra summary columns to an aggregated dataframe.
 
         Args:
-            df (pd.DataFrame)): the full job dataframe to aggregate.
-            group_by_column (list): list of columns to group by. Default is None (the entire dataframe is aggregated)
+            aggregated_df (pd.DataFrame): the aggregated dataframe (modified in place).
 
         Returns:
-            pd.DataFrame: the aggregated dataframe.
+            pd.DataFrame: the aggregated dataframe with the summary columns added.
         """
-        group_by_column1 = group_by_column if group_by_column else (lambda _: True)  # If no group by column is specified, aggregate the entire dataframe
-
-        # Aggregate using the aggregation dictionary
-        aggregated_df = df.groupby(group_by_column1).agg(**aggregation_dict) 
-
-        # Reset the index to make the grouped columns regular columns
-        aggregated_df.reset_index(inplace=True, drop=(group_by_column is None))
-
-        # Add extra summary columns
         aggregated_df['SuccessFraction'] = aggregated_df.successful_jobs / aggregated_df.JobCount # Ratio of successful jobs 
         aggregated_df['FailedFraction'] = 1 - aggregated_df.SuccessFraction  # Ratio of failed jobs
         aggregated_df['EmissionsFraction'] = aggregated_df.TotalEmissions_gCO2e / aggregated_df.TotalEmissions_gCO2e.sum()  # The share of total emissions contribution per group 
 
         return aggregated_df
+
+    # Number of non-null values of each averaged column per day (internal columns, used to weight the daily means in 'total_from_daily')
+    mean_count_dict = {f'_{column}_count': (source_column, 'count') for column, (source_column, function) in aggregation_dict.items() if function == 'mean'}
+
+    def total_from_daily(daily_df):
+        """
+        Function to aggregate the daily dataframe into the total (one row) dataframe, so the job level 
+        columns are only traversed once (by the daily groupby). Sums and counts are the sums of the daily values, 
+        the first/last job times are the min/max of the daily values, and the means are the daily means weighted by 
+        each day's number of non-null values of that column (the internal mean_count_dict columns).
+
+        Args:
+            daily_df (pd.DataFrame): the daily aggregated dataframe, including the group of jobs with no submission date 
+                                     and the mean_count_dict columns (without the summary columns).
+
+        Returns:
+            pd.DataFrame: the total aggregated dataframe (one row summarising all jobs).
+        """
+        # Group the columns by how their daily values combine into the total, so each group is reduced in a single call
+        column_groups = {'sum': [], 'min': [], 'max': [], 'mean': []}
+        for column, (_, function) in aggregation_dict.items():
+            column_groups['sum' if function == 'count' else function].append(column)
+
+        # Reduce each group of columns directly (no groupby), weighting each day's mean by its number of values
+        value_counts = daily_df[list(mean_count_dict)].to_numpy(dtype=float)
+        total = {
+            **daily_df[column_groups['sum']].sum().to_dict(),
+            **daily_df[column_groups['min']].min().to_dict(),
+            **daily_df[column_groups['max']].max().to_dict(),
+            **(daily_df[column_groups['mean']].mul(value_counts).sum() / value_counts.sum(axis=0)).to_dict(),
+        }
+
+        # Build the one row dataframe with the columns in the same order as the aggregation dictionary
+        return pd.DataFrame([{column: total[column] for column in aggregation_dict}])
     
-    # Add a seperate column for the date of each submissions (not the time)
-    df_jobs['SubmissionDate'] = df_jobs.SubmissionTime.dt.date
+    def daily_polars(df, aggregations):
+        """
+        Function to aggregate the job dataframe by day with a Polars lazy query (used when the user selects the 'polars' Engine).
+        Only the columns used by the aggregation are converted, and the column reductions run in parallel.
+        The result is converted back to pandas with the same columns and types as the pandas groupby.
 
-    # Full dataframe: one row per job with all columns (no aggregation)
-    full_df = df_jobs.copy()
+        Args:
+            df (pd.DataFrame): the full job dataframe (with the 'SubmissionDate' column).
+            aggregations (dict): output column -> (input column, aggregation function), as in the aggregation dictionary.
 
-    # Daily aggregated dataframe: one row per day
-    daily_df = aggregation(df_jobs, group_by_column=['SubmissionDate'])
+        Raises:
+            ValueError: If polars (or pyarrow, used for the conversion) is not installed.
 
-    # Total aggregated dataframe: one row summarising all jobs
-    total_df = aggregation(df_jobs)
+        Returns:
+            pd.DataFrame: the daily aggregated dataframe (one row per day, sorted by date).
+        """
+        try:
+            import polars as pl
+            import pyarrow     # required by polars to convert to and from pandas
+        except ImportError as e:
+            raise ValueError(f"The 'polars' Engine requires the 'polars' and 'pyarrow' packages (pip install polars pyarrow), or use --Engine pandas. Error: {e}")
+
+        # Polars expressions equivalent to the aggregation dictionary (counts are cast to match the pandas int64 count)
+        expressions = []
+        for column, (source_column, function) in aggregations.items():
+            expression = getattr(pl.col(source_column), function)()
+            expressions.append((expression.cast(pl.Int64) if function == 'count' else expression).alias(column))
+
+        # Convert only the columns that are aggregated, then group, reduce and sort lazily
+        source_columns = list(dict.fromkeys(source_column for source_column, _ in aggregations.values()))
+        daily = (pl.from_pandas(df[['SubmissionDate'] + source_columns])
+                 .lazy()
+                 .group_by('SubmissionDate')
+                 .agg(expressions)
+                 .sort('SubmissionDate')
+                 .collect())
+
+        # Back to pandas at the boundary
+        return daily.to_pandas()
+    
+    # Add a seperate column for the date of each submissions (not the time). 
+    # Kept as datetime64 (midnight of each day) rather than python date objects so the daily groupby hashes int64 values
+    df_jobs['SubmissionDate'] = df_jobs['SubmissionTime'].dt.floor('D')
+
+    # Full dataframe: one row per job with all columns (no aggregation). 
+    # The jobs dataframe is returned as is rather than copied, as it is not modified after this point
+    full_df = df_jobs
+
+    # Daily aggregated dataframe: one row per day. Jobs with no submission date (NaT) are kept as their own group here 
+    # so they are still counted in the total, and the per day value counts of the averaged columns are added for the total
+    daily_aggregations = {**aggregation_dict, **mean_count_dict}
+    if getattr(arguments, 'Engine', 'pandas') == 'polars':
+        daily_df = daily_polars(df_jobs, daily_aggregations)
+    else:
+        daily_df = df_jobs.groupby('SubmissionDate', as_index=False, dropna=False).agg(**daily_aggregations)
+
+    # Total aggregated dataframe: one row summarising all jobs (derived from the daily aggregates rather than a second pass over the jobs)
+    total_df = add_summary_columns(total_from_daily(daily_df))
+
+    # Remove the group of jobs with no submission date and the internal count columns from the daily output
+    daily_df = daily_df.loc[daily_df['SubmissionDate'].notna(), ['SubmissionDate', *aggregation_dict]].reset_index(drop=True)
+    daily_df = add_summary_columns(daily_df)
 
     # return all three dataframes
     return full_df, daily_df, total_df
@@ -427,11 +580,7 @@ def core_engine(arguments):
         tuple: three dataframes containing the full job data, daily aggregated data and total aggregated data
     """
     # Load the hpc_config.yaml file (user must edit this file to match their HPC system)
-    with open('hpc_config.yaml', 'r') as file:
-        try: 
-            hpc_config = yaml.safe_load(file)  # Load the YAML file into a dictionary
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error loading hpc_config.yaml: {e}")
+    hpc_config = load_hpc_config('hpc_config.yaml')
         
     # Initialise the EnergyEmissionsCalculator class with the loaded configuration and user arguments
     EEC = EnergyEmissionsCalculator(hpc_config, arguments)
@@ -442,6 +591,10 @@ def core_engine(arguments):
     # Add energy consumption and emissions estimates to the job logs dataframe
     df_emissions = add_emissions_data(df_raw, emissions_calculator=EEC, hpc_config=hpc_config)
 
+    # The estimates are added to a new dataframe, so release the raw job logs rather than holding both copies 
+    # in memory for the rest of the run (aggregation, saving and the returned dataframes)
+    del df_raw
+
     # Aggregate the data into final dataframes
     full_df, daily_df, total_df = aggregate_df(df_emissions, arguments=arguments)
 
@@ -21,17 +21,26 @@ This class is used in the main backend program to retrieve the job logs needed t
 import pandas as pd
 import numpy as np 
 import os
-import datetime
-from io import BytesIO
+import re
 import subprocess
-import warnings
 import argparse
 
 # Import functions/classes from modules 
-from .backend_utils import JobLogUtils
+from .backend_utils import JobLogUtils, downcast_df, aggregate_job_steps, aggregate_job_steps_polars, read_sacct_output
+
+# Fields requested from sacct, in output order (also used as the column names, as the header is not requested)
+SACCT_FIELDS = ("UID", "User", "Partition", "JobID", "JobName", "Submit", "State", "Elapsed", "AllocTRES", "NNodes",
+                "NCPUS", "TotalCPU", "CPUTime", "ReqMem", "MaxRSS", "WorkDir", "ConsumedEnergyRaw")
+
+# Column dtypes applied while parsing the sacct output: node/CPU counts as integers, the IPMI energy as a float,
+# low-cardinality fields (a handful of distinct values repeated over every job) as categoricals, 
+# and everything else kept as strings for the processing methods
+SACCT_DTYPES = ({field: 'str' for field in SACCT_FIELDS} | {'NNodes': 'int64', 'NCPUS': 'int64', 'ConsumedEnergyRaw': 'float64'}
+                | {'Partition': 'category', 'User': 'category', 'State': 'category'})
+
+# Pattern extracting the number of allocated GPUs from the AllocTRES field (compiled once at import)
+_GPU_RE = re.compile(r'gres/gpu=(\d+)')
 
-# Suppress pandas SettingWithCopyWarning to avoid cluttering the output
-warnings.filterwarnings("ignore", category=pd.errors.SettingWithCopyWarning)
 
 # This class inherits the utility class to be able to use its methods
 class JobLogProcessor(JobLogUtils):
@@ -55,6 +64,7 @@ class JobLogProcessor(JobLogUtils):
         self.arguments = arguments
 
         # Set placeholders for the logs at different processing stages
+        self.sacct_process = None     # running sacct process (output pipe read by 'df_conversion')
         self.sacct_df = None      # raw sacct output logs converted into a DataFrame 
         self.cleaned_df = None  # Intermediate cleaned logs df 
         self.filtered_df = None     # Filtered logs (job-level) df
@@ -66,42 +76,40 @@ class JobLogProcessor(JobLogUtils):
         Fetches job accounting logs from SLURM by running 'sacct' on the command line. 
         This method retrieves the accounting logs based on the arguments (e.g. start and end dates). 
         The output includes raw job metadata which is parsed and processed later.
+
+        sacct is started without waiting for it to finish: its output is streamed straight into
+        'df_conversion' through a pipe, rather than being buffered into memory first.
         """
         # Construct the SLURM command with the user arguments and correct formatting
         slurm_command = [
             "sacct",
             "--start", self.arguments.StartDate,
             "--end", self.arguments.EndDate,
-            "--format",
-            "UID,USER,Partition,JobID,JobName,Submit,State,Elapsed,AllocTRES,NNodes,NCPUS,TotalCPU,CPUTime,ReqMem,MaxRSS,WorkDir,ConsumedEnergyRaw",
-            "-P"    # Pipe delimiter for easier parsing (separated by '|')
+            "--format", ",".join(SACCT_FIELDS),
+            "--parsable2",  # Pipe delimiter for easier parsing (separated by '|'), without a trailing '|' on each line
+            "--noheader"    # Column names are supplied when parsing (SACCT_FIELDS)
         ]
 
-        # Run the sacct command and capture its output as raw bytes 
-        process = subprocess.run(slurm_command, stdout=subprocess.PIPE) 
-        
-        # Save the output as a class attribute for later processing
-        self.sacct_data = process.stdout
+        # Start the sacct command with its output connected to a pipe (buffered reads of 1 MiB)
+        # and save the process as a class attribute for 'df_conversion' to read from
+        self.sacct_process = subprocess.Popen(slurm_command, stdout=subprocess.PIPE, bufsize=1 << 20)
 
 
     def df_conversion(self):
         """
         Transforms the raw 'sacct' output logs into a structured pandas Dataframe 
-        by parsing the output (stored as bytes) into a more friendly tabular format.
+        by parsing the output (read directly from the sacct pipe) into a more friendly tabular format.
         """
-        # Seperate fields on '|'
-        sacct_df = pd.read_csv(BytesIO(self.sacct_data), sep="|", dtype='str')
+        # Seperate fields on '|' (no header line is requested from sacct, so the field names are passed in).
+        # The parser (pyarrow's if installed, otherwise pandas' C parser) reads the pipe while sacct is still writing to it, 
+        # converting the numeric and categorical columns as it goes
+        with self.sacct_process.stdout as sacct_output:
+            sacct_df = read_sacct_output(sacct_output, SACCT_DTYPES)
+        self.sacct_process.wait()   # Reap the finished sacct process
 
-        # Convert ConsumedEnergyRaw (energy IPMI plugin) from sting to float
-        if 'ConsumedEnergyRaw' in sacct_df.columns: 
-            sacct_df['ConsumedEnergyRaw'] = pd.to_numeric(sacct_df['ConsumedEnergyRaw'], errors='coerce').fillna(0)  # Convert to float, fill NaN with 0
-            sacct_df['EnergyIPMI_kwh'] = sacct_df['ConsumedEnergyRaw'] / 3600000    # Joules to kWh conversion 
-        else:
-            sacct_df['EnergyIPMI_kwh'] = 0.0
-
-        # set some numeric columns (number of nodes and CPUs) to integers so they can be used in calculations
-        for column in ['NNodes', 'NCPUS']:
-            sacct_df[column] = sacct_df[column].astype('int64')
+        # ConsumedEnergyRaw (energy IPMI plugin) is already parsed as a float
+        sacct_df['ConsumedEnergyRaw'] = sacct_df['ConsumedEnergyRaw'].fillna(0)  # fill NaN (not recorded) with 0
+        sacct_df['EnergyIPMI_kwh'] = sacct_df['ConsumedEnergyRaw'] / 3600000    # Joules to kWh conversion 
 
         # Store the df in the placeholder class attribute
         self.sacct_df = sacct_df
@@ -117,59 +125,63 @@ class JobLogProcessor(JobLogUtils):
         ### ADDING COLUMNS TO THE DATAFRAME ###
         ### ------------------------------- ###
 
-        # Add columns that don't require processing (rename them to prevent accidental overwriting of data)
-        self.sacct_df['UserID'] = self.sacct_df.UID     # User ID
-        self.sacct_df['UserName'] = self.sacct_df.User      # Username
-        self.sacct_df['NameofJob'] = self.sacct_df.JobName      # Job name
-        self.sacct_df['CPUsAllocated'] = self.sacct_df.NCPUS        # Number of CPUs allocated for the job
-        self.sacct_df['TotalNodes'] = self.sacct_df.NNodes      # Total number of Nodes used
-        self.sacct_df['WorkingDirectory'] = self.sacct_df.WorkDir       # The working directory the job was ran from
-
         # Process elapsed runtime of jobs (wallclock time) by converting strings to timedelta objects
-        self.sacct_df['ElapsedRuntime'] = self.sacct_df['Elapsed'].apply(self.str_to_timedelta)
-
-        # Process the partition names using method from utility class
-        self.sacct_df['PartitionName'] = self.sacct_df.apply(self.process_partition_field, axis=1)
+        self.sacct_df['ElapsedRuntime'] = self.parse_timedelta_series(self.sacct_df['Elapsed'])
 
-        # Extract job ID removing the '.' part for each row in the df
-        self.sacct_df['Job_ID'] = self.sacct_df.JobID.apply(lambda id_string: id_string.split('.')[0])
+        # Extract job ID removing the '.' (job step) part, for the whole column at once
+        self.sacct_df['Job_ID'] = self.sacct_df.JobID.str.split('.', n=1).str[0]
 
-        # Process the job submission time (convert from string timestamp to datetime object)
-        self.sacct_df['SubmissionTime'] = self.sacct_df.Submit.apply(lambda submit_str: datetime.datetime.strptime(submit_str, "%Y-%m-%dT%H:%M:%S"))
+        # Process the job submission time (convert from string timestamp to datetime64 in one vectorised parse; 
+        # cache=True parses each distinct timestamp once, as the steps of a job share its submit time)
+        self.sacct_df['SubmissionTime'] = pd.to_datetime(self.sacct_df['Submit'], format="%Y-%m-%dT%H:%M:%S", cache=True, errors='coerce')
 
         # Normalise the jobs state into a standard integer using utility method
-        self.sacct_df['StateCode'] = self.sacct_df['State'].apply(self.standardise_states)
+        self.sacct_df['StateCode'] = self.standardise_states_series(self.sacct_df['State'])
 
-        # Extract the number of allocated GPUs for each job
-        # Sometimes AllocTRES may not be available for older versions of SLURM
-        if 'AllocTRES' in self.sacct_df.columns:        # If AllocTRES is available extract GPUs from output by searching for gres/gpu
-            self.sacct_df['GPUsAllocated'] = (pd.to_numeric(self.sacct_df.AllocTRES.str.extract(r'((?<=gres\/gpu=)\d+)', expand=False)).fillna(0).astype('int64'))
-            # Fills 0 if it cannot find gres/gpu 
-        else:   # if AllocTRES not available due to old slurm version 
-            print("WARNING - 'AllocTRES' sacct command not found due to incompatible SLURM version.")
-            self.sacct_df['GPUsAllocated'] = 0      # default to 0
+        # Extract the number of allocated GPUs for each job by searching the AllocTRES output for gres/gpu
+        self.sacct_df['GPUsAllocated'] = (pd.to_numeric(self.sacct_df.AllocTRES.str.extract(_GPU_RE, expand=False)).fillna(0).astype('int64'))
+        # Fills 0 if it cannot find gres/gpu 
 
         # Extract the total CPU time (i.e. Actual CPU time consumed by a job, summed across all CPUs - measured)
-        self.sacct_df['ActualCPUtime'] = self.sacct_df['TotalCPU'].apply(self.str_to_timedelta)
+        self.sacct_df['ActualCPUtime'] = self.parse_timedelta_series(self.sacct_df['TotalCPU'])
 
         # Extract the estimated CPU time (NCPUS * Elapsed). (i.e. the max CPU time if all cores were 100% utilised)
-        if 'CPUTime' in self.sacct_df.columns:      # If CPUTime is available
-            self.sacct_df['CPUwalltime'] = self.sacct_df['CPUTime'].apply(self.str_to_timedelta)
-        else:       # If CPUTime is not available, calculate it manually 
-            self.sacct_df['CPUwalltime'] = self.sacct_df.ElapsedRuntime * self.sacct_df.NCPUS
+        self.sacct_df['CPUwalltime'] = self.parse_timedelta_series(self.sacct_df['CPUTime'])
+
+        # Add seconds versions of the runtime columns (int64 ElapsedSec and CPUwalltimeSec, float ActualCPUtimeSec) for the hours calculations
+        self.add_seconds_columns(self.sacct_df)
+
+        # Process the partition names using method from utility class (warns about running jobs logged with multiple partitions)
+        self.sacct_df['PartitionName'] = self.process_partition_field_series(self.sacct_df).astype('category')
 
         # Log the memory requested by the user for each job (converted to GB)
-        self.sacct_df['RequestedMemoryGB'] = self.sacct_df.apply(self.requested_memory, axis=1)
+        self.sacct_df['RequestedMemoryGB'] = self.requested_memory_series(self.sacct_df)
 
         # Log the memory actually used by each job (converted to GB)
-        self.sacct_df['UsedMemoryGB'] = self.sacct_df.apply(self.process_max_rss, axis=1)
+        self.sacct_df['UsedMemoryGB'] = self.process_max_rss_series(self.sacct_df['MaxRSS'])
+
+        # Rename the columns that don't require processing (in place, rather than copying them to new columns)
+        self.sacct_df.rename(columns={
+            'UID': 'UserID',        # User ID
+            'User': 'UserName',     # Username
+            'JobName': 'NameofJob',     # Job name
+            'NCPUS': 'CPUsAllocated',       # Number of CPUs allocated for the job
+            'NNodes': 'TotalNodes',     # Total number of Nodes used
+            'WorkDir': 'WorkingDirectory'       # The working directory the job was ran from
+        }, inplace=True)
 
         ### ----------------------- ###
         ### FILTERING THE DATAFRAME ###
         ### ----------------------- ###
 
-        # Groups rows by Job ID, merging each column across job steps (so the df has 1 row per job)
-        self.cleaned_df = self.sacct_df.groupby('Job_ID').agg({
+        # Groups rows by Job ID, merging each column across job steps (so the df has 1 row per job).
+        # The rows are sorted by Job ID and each column reduced in a single numpy pass (same result as groupby().agg()),
+        # or with a multi-threaded Polars query if the user selected the 'polars' Engine
+        if getattr(self.arguments, 'Engine', 'pandas') == 'polars':
+            merge_job_steps = aggregate_job_steps_polars
+        else:
+            merge_job_steps = aggregate_job_steps
+        self.cleaned_df = merge_job_steps(self.sacct_df, 'Job_ID', {
             'UserID': 'first',      # Take the first entry
             'UserName': 'first', 
             'NameofJob': 'first',
@@ -183,41 +195,33 @@ class JobLogProcessor(JobLogUtils):
             'GPUsAllocated': 'max',
             'ActualCPUtime': 'max',
             'CPUwalltime': 'max',
+            'ElapsedSec': 'max',
+            'ActualCPUtimeSec': 'max',
+            'CPUwalltimeSec': 'max',
             'RequestedMemoryGB': 'max',
             'UsedMemoryGB': 'max',
             'EnergyIPMI_kwh': 'max'   
         })
 
-        # Filter out jobs that are still running or pending (StateCode -2)
-        self.filtered_df = self.cleaned_df.loc[self.cleaned_df.StateCode != -2]
+        # Filter out jobs that are still running or pending (StateCode -2). 
+        # Copied once so the columns added below are written to filtered_df directly (not to a view of cleaned_df)
+        self.filtered_df = self.cleaned_df.loc[self.cleaned_df.StateCode != -2].copy()
 
         # If MaxRSS was not recorded, make used memory equal to requested memory using utility method
-        self.filtered_df['UsedMemoryGB1'] = self.filtered_df.apply(self.used_memory, axis=1)
+        self.filtered_df['UsedMemoryGB1'] = self.used_memory_series(self.filtered_df)
 
         # Set the partition category column (i.e. processor type)
-        self.filtered_df['PartitionCategory'] = self.filtered_df.PartitionName.apply(self.categorise_partition)
-
-        # Set GPUs to 1 as a fallback if AllocTRES is missing.
-        if 'AllocTRES' not in self.sacct_df.columns:
-            self.filtered_df.loc[self.filtered_df.PartitionCategory == 'GPU', 'GPUsAllocated'] = 1
+        self.filtered_df['PartitionCategory'] = self.categorise_partition_series(self.filtered_df.PartitionName).astype('category')
 
-        # Determine which CPU usage time is available for calculations 
-        self.filtered_df['CPUusagetime'] = self.filtered_df.apply(self.CPU_usage_time, axis=1)
-
-        # Determine which GPU usage time is available for calculations
-        self.filtered_df['GPUusagetime'] = self.filtered_df.apply(self.GPU_usage_time, axis=1)
-
-        # Compute the total CPU-Hours and GPU-Hours used for each job
-        self.filtered_df[['CPUhours', 'GPUhours']] = self.filtered_df.apply(self.cpu_gpu_core_hours, axis=1, result_type='expand')
-
-        # Compute the total Node-Hours used for each job
-        self.filtered_df['NodeHours'] = self.filtered_df.apply(self.node_hours, axis=1)
+        # Determine the CPU and GPU usage times available for calculations, and compute the total CPU-Hours, 
+        # GPU-Hours and Node-Hours used for each job (all five columns in one vectorised block)
+        self.filtered_df = self.filtered_df.assign(**self.usage_and_hours_series(self.filtered_df))
 
         # Compute the minimum amount of memory required for each job to run
-        self.filtered_df['RequiredMemoryGB'] = self.filtered_df.apply(self.min_memory_required, axis=1)
+        self.filtered_df['RequiredMemoryGB'] = self.min_memory_required_series(self.filtered_df.RequestedMemoryGB, self.filtered_df.UsedMemoryGB1)
 
         # Compute the amount of memory that was overallocated (i.e. wasted memory)
-        self.filtered_df['WastedMemoryRatio'] = self.filtered_df.apply(self.wasted_memory, axis=1)
+        self.filtered_df['WastedMemoryRatio'] = self.wasted_memory_series(self.filtered_df)
 
         ### ------------------------------------------ ###
         ### OPTIONAL FILTERING BASED ON USER ARGUMENTS ###
@@ -227,12 +231,17 @@ class JobLogProcessor(JobLogUtils):
         self.filtered_df.reset_index(inplace=True)
 
         # Clean the Job ID column (get main job ID)
-        self.filtered_df['MainJobID'] = self.filtered_df.Job_ID.apply(self.extract_jobID)
+        self.filtered_df['MainJobID'] = self.extract_jobID_series(self.filtered_df.Job_ID)
 
         # If user specifies in arguments, filter by Job ID (only keep specified IDs in the df)
         if self.arguments.JobIDs != 'all_jobs':     # this is the default
             preserved_ids = self.arguments.JobIDs.split(',')        # split the jobs IDs on the comma if user provides multiple 
-            self.filtered_df = self.filtered_df.loc[self.filtered_df.MainJobID.isin(preserved_ids)]
+
+            # Compare integer category codes rather than hashing every job's ID string against the preserved IDs
+            # (IDs not found in the logs get code -1 and are dropped)
+            main_job_ids = pd.Categorical(self.filtered_df.MainJobID)
+            preserved_codes = pd.Categorical(preserved_ids, categories=main_job_ids.categories).codes
+            self.filtered_df = self.filtered_df.loc[np.isin(main_job_ids.codes, preserved_codes[preserved_codes >= 0])]
 
         # If user specifies in arguments, filter by working directory that the jobs were ran
         # if self.arguments.WD is not None:
@@ -247,4 +256,6 @@ class JobLogProcessor(JobLogUtils):
             'UsedMemoryGB1', 'RequiredMemoryGB', 'WastedMemoryRatio', 'WorkingDirectory','EnergyIPMI_kwh'
         ]
 
-        self.final_df = self.filtered_df[column_order]
+        # Select the columns in order without an extra copy (reindex already returns a new frame, so downcasting 
+        # its columns does not touch filtered_df), then downcast them to smaller dtypes to reduce memory use in the later stages
+        self.final_df = downcast_df(self.filtered_df.reindex(columns=column_order, copy=False))
@@ -16,6 +16,15 @@ Key Functions:
 - 'results_terminal_display(full_df, daily_df, total_df, arguments, hpc_config)':  
     Displays a full breakdown of energy and emissions results in the terminal, including summary panels, statistics, and annotated emissions breakdowns.
 
+- 'static_markup_text(markup)':  
+    Parses a static rich markup string into a Text object once (used to build the unchanging parts of the report at import).
+
+- 'report_text(*parts)':  
+    Builds a Text object for a dynamic section of the report from plain and (string, style) runs, without markup parsing.
+
+- 'PlainConsole':  
+    Plain text stand-in for rich's Console, used by 'results_terminal_display' when the output is redirected or piped.
+
 - 'main_cli_script_output(full_df, daily_df, total_df, arguments)':  
     Main frontend function for CLI/script use. Loads the HPC config file and calls 'results_terminal_display' to produce the full output.
 """
@@ -24,18 +33,169 @@ Key Functions:
 
 
 # Import libraries 
-from rich import print
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from rich.rule import Rule
+from rich.highlighter import ReprHighlighter
 import numpy as np 
-import pandas as pd
-import datetime
-import yaml 
+import sys
 
 # Import functions from other modules
-from .jupyter_output import emissions_unit_converter, tree_months_formatter
+from .formatters import emissions_unit_converter_array, scope3_factor_label, tree_months_formatter
+from ..config import load_hpc_config
+
+
+# ------------------------------------------------------
+# STATIC REPORT TEXT
+# ------------------------------------------------------
+# The parts of the report that never change are built once at import: their markup is parsed
+# (and highlighted, as console.print does for strings) here rather than on every call.
+_HIGHLIGHTER = ReprHighlighter()
+
+
+def static_markup_text(markup):
+    """
+    Function to parse a static rich markup string into a Text object once, applying the same
+    emoji replacement and highlighting that 'console.print' applies to strings.
+
+    Args:
+        markup (str): rich markup string
+
+    Returns:
+        Text: the rendered text, ready to be printed
+    """
+    return _HIGHLIGHTER(Text.from_markup(markup))
+
+
+def report_text(*parts):
+    """
+    Function to build a dynamic section of the report directly from its styled runs (no markup for rich to lex),
+    applying the same highlighting that 'console.print' applies to strings.
+
+    Args:
+        *parts (str or tuple): plain strings, or (string, style) pairs for the styled runs
+
+    Returns:
+        Text: the assembled text, ready to be printed
+    """
+    text = Text.assemble(*parts)
+
+    # Highlight the plain text first and lay the styled runs over it (the order console.print uses for markup,
+    # so e.g. a [cyan] runtime keeps its colour over the highlighted time)
+    highlighted = _HIGHLIGHTER(text.plain)
+    highlighted.copy_styles(text)
+    return highlighted
+
+
+# Introduction text
+_INTRO_TEXT = static_markup_text(
+    "This tool estimates the energy consumption, scope 2 and scope 3 carbon emissions of your SLURM HPC jobs. "
+    "If energy counters are available, it will use them. Otherwise it will estimate energy and emissions from usage data and cluster-specific TDP values.\n\n"
+    "Carbon intensity for scope 2 emissions (operational) is retrieved from the regional Carbon Intensity API (https://carbonintensity.org.uk) at the time of job submission. "
+    "Scope 3 emissions (embodied) are estimated from the node-hours used by the job, and the scope 3 emissions factor. "
+    "For Isambard systems and Archer2, these scope 3 factors are calculated from the total lifecycle scope 3 emissions for each system divided by the total node-hours available over the system's projected lifetime.\n"
+    "\nThe results below are calculated using SLURM accounting data for jobs submitted to the "
+    "Isambard-AI cluster, including information such as runtime, resource allocation, resource usage, "
+    "hardware-level energy counters (if available), etc. For a detailed explanation of all methodologies used, "
+    "please refer to the GRACE-HPC documentation.\n"
+)
+
+# Note 
+_NOTE_TEXT = Text()
+_NOTE_TEXT.append("Note:", style="bold yellow")
+_NOTE_TEXT.append(" The results presented here are estimates based on the available data and methodologies with assumptions and limitations. ")
+_NOTE_TEXT.append("Hence this tool should be used for ", style="")
+_NOTE_TEXT.append("informational purposes only", style="bold")
+_NOTE_TEXT.append(", not as a definitive energy and carbon cluster monitoring tool.\n")
+
+# Note under the carbon footprint section
+_GRID_NOTE_TEXT = static_markup_text(
+    "\n\n[italic dim]Note:[/italic dim] For Isambard systems and Archer2, market-based Scope 2 emissions = 0 gCO₂e due to 100% certified zero-carbon electricity contracts.\n"
+    "The estimates above are based on the UK national grid carbon intensity and are provided for informational purposes,\n"
+    "representing what the emissions would be if Isambard systems were not powered by renewable energy (the grid only).\n\n"
+)
+
+# Note under the failed jobs section
+_FAILED_JOBS_NOTE_TEXT = static_markup_text(
+    "\n[italic dim]Note:[/italic dim] Failed HPC jobs are a significant source of wasted computational resources and unnecessary carbon emissions.\n"
+    "Every failed job still consumes electricity for scheduling, startup, and partial execution—without producing useful results.\n"
+    "Reducing failed jobs is a simple yet impactful way to lower your carbon footprint on HPC systems.\n"
+)
+
+# Documentation and feedback text
+_DOCS_TEXT = static_markup_text(
+    "\nFind the methodology including assumptions and limitations of this tool outlined in the documentation:\n"
+    "https://github.com/Elliot-Ayliffe/GRACE-HPC/tree/main\n\n"
+    "See also what other features are available with the package/API including an interactive [bold]Jupyter Notebook interface[/bold].\n\n"
+    "If you find any bugs, have questions, or suggestions for improvements, please post these on the GitHub repository.\n"
+)
+
+# Layout of the contextual equivalents section (filled in with 'format_map' on each call)
+_EQUIVALENTS_TEMPLATE = """
+    [bold]🚗 Driving[/bold] {driving_miles:,.2f} miles            (0.21 kgCO2e/mile average UK car, 2023)
+    [bold]🌲 Tree absorption:[/bold] {tree_months_text}            (0.83 kgCO2e/month average UK tree carbon sequestration rate)
+    [bold]✈️ Flying[/bold] {bris_paris_flights:,.3f} times from Bristol to Paris            (140 kgCO2e/passenger)
+    [bold]🏠 UK Households:[/bold] Daily emissions from {uk_houses:,.1f} households' electricity use             (UK average)
+
+    [bold]Approximate electricity cost:[/bold] £{total_cost:.2f}        (at {GBP_per_kwh:.4f} GBP/kWh)
+
+    [italic]See documentation for sources and assumptions of these estimates.[/italic]\n
+    """
+
+# Section headers
+_SECTION_RULES = {title: Rule(title, style="bold cyan") for title in (
+    "OVERVIEW",
+    "⚡️ ENERGY CONSUMPTION",
+    "🌿 CARBON FOOTPRINT",
+    "THIS IS EQUIVALENT TO:",
+    "⚙️ USAGE STATISTICS",
+    "❌ FAILED JOBS & WASTED MEMORY IMPACT",
+    "DOCUMENTATION & FEEDBACK",
+)}
+
+
+class PlainConsole:
+    """
+    Minimal stand-in for rich's Console, used when the report is not going to a terminal or notebook
+    (e.g. redirected to a file or piped into another command). Every renderable is written as plain text,
+    so none of rich's layout, box drawing or highlighting work is done for output where it would not be shown.
+    Like Console, output printed inside a 'with' block is buffered and written in one go when the block exits.
+    """
+    def __init__(self, file=None):
+        self.file = file if file is not None else sys.stdout
+        self._buffer = None
+
+    def __enter__(self):
+        self._buffer = []
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.file.write("".join(self._buffer))
+        self.file.flush()
+        self._buffer = None
+
+    @staticmethod
+    def plain_text(renderable):
+        """
+        Convert one of the report's renderables (markup string, Text, Rule or Panel) into plain text.
+        """
+        if isinstance(renderable, str):
+            return Text.from_markup(renderable).plain
+        if isinstance(renderable, Rule):
+            return f"\n---------- {renderable.title} ----------"
+        if isinstance(renderable, Panel):
+            return f"{renderable.title}: {PlainConsole.plain_text(renderable.renderable)}"
+        if isinstance(renderable, Text):
+            return renderable.plain
+        return str(renderable)
+
+    def print(self, *renderables):
+        text = " ".join(self.plain_text(renderable) for renderable in renderables) + "\n"
+        if self._buffer is not None:
+            self._buffer.append(text)
+        else:
+            self.file.write(text)
 
 
 
@@ -56,319 +216,280 @@ def results_terminal_display(full_df, daily_df, total_df, arguments, hpc_config)
         None: prints the results using the rich library.
     """
     console = Console()
-    console.print("\n")
-    # Create title
-    title_text = Text(f"Carbon Footprint Estimation for HPC Jobs ran on {hpc_config['hpc_system']}", style="bold cyan")
-
-    # Wrap it in a panel
-    panel = Panel(
-        title_text,
-        expand=True,
-        border_style="green",
-        padding=(1, 5),
-        title="🌱 GRACE-HPC",
-        title_align="left"
-    )
-
-    console.print(panel)
-
-    # Introduction text
-    intro = (
-        "This tool estimates the energy consumption, scope 2 and scope 3 carbon emissions of your SLURM HPC jobs. "
-        "If energy counters are available, it will use them. Otherwise it will estimate energy and emissions from usage data and cluster-specific TDP values.\n\n"
-        "Carbon intensity for scope 2 emissions (operational) is retrieved from the regional Carbon Intensity API (https://carbonintensity.org.uk) at the time of job submission. "
-        "Scope 3 emissions (embodied) are estimated from the node-hours used by the job, and the scope 3 emissions factor. "
-        "For Isambard systems and Archer2, these scope 3 factors are calculated from the total lifecycle scope 3 emissions for each system divided by the total node-hours available over the system's projected lifetime.\n"
-        "\nThe results below are calculated using SLURM accounting data for jobs submitted to the "
-        "Isambard-AI cluster, including information such as runtime, resource allocation, resource usage, "
-        "hardware-level energy counters (if available), etc. For a detailed explanation of all methodologies used, "
-        "please refer to the GRACE-HPC documentation.\n"
-    )
-    console.print(intro, style="")
-
-    # Note 
-    note = Text()
-    note.append("Note:", style="bold yellow")
-    note.append(" The results presented here are estimates based on the available data and methodologies with assumptions and limitations. ")
-    note.append("Hence this tool should be used for ", style="")
-    note.append("informational purposes only", style="bold")
-    note.append(", not as a definitive energy and carbon cluster monitoring tool.\n")
-    console.print(note)
-
-    # ------------------------------------------------------
-    # OVERVIEW INFO: USER, DATES AND JOB IDS
-    # ------------------------------------------------------
-    # Check if the total_df is empty
+
+    # Plain text fast path when the output is not displayed by a terminal or notebook (rich's rendering would not be seen)
+    if not console.is_terminal and not console.is_jupyter:
+        console = PlainConsole()
+
+    # Check if the total_df is empty before building any of the report (title panel, intro text etc.)
     if total_df.empty:
         console.print("[bold red]No job data available to analyse.[/]")
         return
 
-    # Extract variables from arguments and data 
-    user_name = full_df.iloc[0].get("UserName", "N/A")
-    start_date = arguments.StartDate if hasattr(arguments, "StartDate") else "N/A"
-    end_date = arguments.EndDate if hasattr(arguments, "EndDate") else "N/A"
-    hpc_name = hpc_config.get('hpc_system', 'Unknown HPC System')
-
-    # Job ID to filter on 
-    if arguments.JobIDs == 'all_jobs':
-        job_ids_msg = "[bold]Jobs:[/bold] Processing all jobs in the selected date range"
-    else:
-        job_ids_msg = f"[bold]Jobs:[/bold] Processing only for job IDs: [cyan]{arguments.JobIDs}[/cyan]"
-
-     # Check if energy counters were available
-    if "EnergyIPMI_kwh" in total_df.columns:
-
-        if (full_df['EnergyIPMI_kwh'] > 0).all():
-            energy_counter_status = "✅ Yes — hardware energy counters were available for all jobs and are used in calculations!"
-        else: 
-            energy_counter_status = "❌ Not available for all jobs — hardware energy counters were not used in calculations. Usage-based estimates were used instead."
-
-    else:
-        energy_counter_status = "⚠️ Unknown — energy counter column not found in the data"
-
-    console.print(Rule("OVERVIEW", style="bold cyan"))
-
-    # print the overview
-    console.print(f"""
-    [bold]HPC System:[/bold] {hpc_name}
-    [bold]User Name:[/bold] {user_name}
-    [bold]Date Range:[/bold] {start_date} to {end_date}
-    {job_ids_msg}
-    [bold]System PUE:[/bold] {hpc_config.get('PUE', 'Unknown')}
-    [bold]System Energy Counters:[/bold] {energy_counter_status}\n
-    """)
-
-    # ------------------------------------------------------
-    # ENERGY INFO: USAGE-BASED AND ENERGY COUNTER-BASED ESTIMATES
-    # ------------------------------------------------------
-    row = total_df.iloc[0]  # Get the first and only row of the total_df
-
-    # Extract total energy values aggregated over all jobs (from the total_df)
-    energy_total = row['energy_estimated_kwh']
-    energy_no_pue = row["energy_estimated_noPUE_kwh"]
-    cpu_energy = row["CPU_energy_estimated_kwh"]
-    gpu_energy = row["GPU_energy_estimated_kwh"]
-    mem_energy = row["memory_energy_estimated_kwh"]
-    counter_energy = row["EnergyIPMI_kwh"]
-    dc_overhead = energy_total - energy_no_pue
-    job_count = row['JobCount']
-
-    # Message for counter-based energy 
-    if (full_df['EnergyIPMI_kwh'] > 0).all():
-        counter_energy_msg = f"{counter_energy:,.4f} kWh"
-        job_avg_energy = counter_energy / job_count
-
-    else:
-        counter_energy_msg =  "N/A (not all jobs had energy counters available)"
-        job_avg_energy = energy_total / job_count
-
-    console.print(Rule("⚡️ ENERGY CONSUMPTION", style="bold cyan"))
-
-    # Print total energy statistics
-    console.print(f"""
-    [bold]Total Energy Used (estimated):[/bold] {energy_total:,.4f} kWh
-
-         - [bold]CPUs:[/bold] {cpu_energy:,.4f} kWh
-         - [bold]GPUs:[/bold] {gpu_energy:,.4f} kWh
-         - [bold]Memory:[/bold] {mem_energy:,.4f} kWh
-         - [bold]Data Centre Overheads (PUE):[/bold] {dc_overhead:,.4f} kWh
-
-    [bold]Compute Energy Use (estimated):[/bold] {energy_no_pue:,.4f} kWh  
-    [bold]Compute Energy Use (measured by system counters):[/bold] {counter_energy_msg}\n
-    """)
-
-    # ------------------------------------------------------
-    # CARBON FOOTPRINT BOX: SCOPE 2 AND SCOPE 3 EMISSIONS
-    # ------------------------------------------------------
-
-    # Extract emissions values from the total_df
-    scope2_usage = row["Scope2Emissions_gCO2e"]
-    scope2_counter = row["Scope2Emissions_IPMI_gCO2e"]
-    total_emissions = row["TotalEmissions_gCO2e"]
-    total_avg_ci = row["CarbonIntensity_gCO2e_kwh"]
-    ci_values = full_df["CarbonIntensity_gCO2e_kwh"].dropna()
-    q1 = ci_values.quantile(0.25)
-    median = ci_values.median()
-    q3 = ci_values.quantile(0.75)
-
-
-
-    # determine whether to display counter-based scope 2 emissions
-    if (full_df['EnergyIPMI_kwh'] > 0).all():
-        scope2_counter_msg = emissions_unit_converter(scope2_counter)
-        total_emissions_msg = (
-            f"{emissions_unit_converter(total_emissions)} "
-            f"(system counter-based)"
-        )
-    
-    else:
-        scope2_counter_msg = "N/A (not all jobs had energy counters available)"
-        total_emissions_msg = (
-            f"{emissions_unit_converter(total_emissions)} "
-            f"(usage-based)"
+    # Buffer everything printed inside this block and write it to the terminal in one go when the block exits
+    # (a single write instead of one per print call)
+    with console:
+        console.print("\n")
+        # Create title
+        title_text = Text(f"Carbon Footprint Estimation for HPC Jobs ran on {hpc_config['hpc_system']}", style="bold cyan")
+
+        # Wrap it in a panel
+        panel = Panel(
+            title_text,
+            expand=True,
+            border_style="green",
+            padding=(1, 5),
+            title="🌱 GRACE-HPC",
+            title_align="left"
         )
 
-    # Handle scope 3 emissions 
-    scope3_msg = None
-    scope3_value = None             
-
-    if arguments.Scope3 != 'no_scope3':
-        scope3_value = row.get("Scope3Emissions_gCO2e", None)
-        if scope3_value is not None:
-
-            scope3_label = ""
-            scope3_nodeh_factor = None
-
-            # Determine the per nodehour scope 3 emissions factor to display next to value
-            if arguments.Scope3 == 'Isambard3':
-                scope3_nodeh_factor = 43
-            elif arguments.Scope3 == 'IsambardAI':
-                scope3_nodeh_factor = 114
-            elif arguments.Scope3 == 'Archer2':
-                scope3_nodeh_factor = 23
-            else:                                   # If the user gives a custom numeric value (e.g. "50") instead of a system name
-                try:
-                    scope3_nodeh_factor = float(arguments.Scope3)
-                except Exception:
-                    pass        # don't display the per nodehour emissions factor
-            
-
-            if scope3_nodeh_factor is not None:
-                scope3_label = f" ({scope3_nodeh_factor} gCO2e/node-hour)"
-            
-            # final scope3 text 
-            scope3_msg = f"{emissions_unit_converter(scope3_value)}{scope3_label}"
-
-    # Print carbon footprint section 
-    console.print(Rule("🌿 CARBON FOOTPRINT", style="bold cyan"))
-
-    if scope3_msg is not None:
-        scope3_line = f"[bold]Scope 3 Emissions:[/bold] {scope3_msg}\n"
-    else:
-        scope3_line = ""
-
-    console.print(f"""
-    [bold]Scope 2 Emissions (usage-based):[/bold] {emissions_unit_converter(scope2_usage)}
-    [bold]Scope 2 Emissions (system counter-based):[/bold] {scope2_counter_msg}
-    {scope3_line}
-    [bold]Total Emissions:[/bold] {total_emissions_msg}
-
-    Average Carbon Intensity: {total_avg_ci:,.1f} gCO2e/kWh ({arguments.Region})
-    CI distribution (gCO2e/kWh): [bold]Q1:[/bold] {q1:,.1f}, [bold]Median:[/bold] {median:,.1f} , [bold]Q3:[/bold] {q3:,.1f} 
-    """)
-
-    console.print(
-    "\n\n[italic dim]Note:[/italic dim] For Isambard systems and Archer2, market-based Scope 2 emissions = 0 gCO₂e due to 100% certified zero-carbon electricity contracts.\n"
-    "The estimates above are based on the UK national grid carbon intensity and are provided for informational purposes,\n"
-    "representing what the emissions would be if Isambard systems were not powered by renewable energy (the grid only).\n\n"
-    )
+        console.print(panel)
+
+        # Introduction text
+        console.print(_INTRO_TEXT)
+
+        # Note 
+        console.print(_NOTE_TEXT)
+
+        # ------------------------------------------------------
+        # OVERVIEW INFO: USER, DATES AND JOB IDS
+        # ------------------------------------------------------
+        # Extract variables from arguments and data 
+        user_name = full_df["UserName"].iat[0] if "UserName" in full_df.columns else "N/A"     # positional scalar lookup (no row Series is built)
+        counters_available = "EnergyIPMI_kwh" in full_df.columns and bool((full_df['EnergyIPMI_kwh'] > 0).all())    # every job had energy counters (checked once for all sections)
+        start_date = arguments.StartDate if hasattr(arguments, "StartDate") else "N/A"
+        end_date = arguments.EndDate if hasattr(arguments, "EndDate") else "N/A"
+        hpc_name = hpc_config.get('hpc_system', 'Unknown HPC System')
+
+        # Job ID to filter on 
+        if arguments.JobIDs == 'all_jobs':
+            job_ids_msg = (("Jobs:", "bold"), " Processing all jobs in the selected date range")
+        else:
+            job_ids_msg = (("Jobs:", "bold"), " Processing only for job IDs: ", (arguments.JobIDs, "cyan"))
+
+         # Check if energy counters were available
+        if "EnergyIPMI_kwh" in total_df.columns:
+
+            if counters_available:
+                energy_counter_status = "✅ Yes — hardware energy counters were available for all jobs and are used in calculations!"
+            else: 
+                energy_counter_status = "❌ Not available for all jobs — hardware energy counters were not used in calculations. Usage-based estimates were used instead."
+
+        else:
+            energy_counter_status = "⚠️ Unknown — energy counter column not found in the data"
+
+        console.print(_SECTION_RULES["OVERVIEW"])
+
+        # print the overview
+        console.print(report_text(
+            "\n    ", ("HPC System:", "bold"), f" {hpc_name}\n",
+            "    ", ("User Name:", "bold"), f" {user_name}\n",
+            "    ", ("Date Range:", "bold"), f" {start_date} to {end_date}\n",
+            "    ", *job_ids_msg, "\n",
+            "    ", ("System PUE:", "bold"), f" {hpc_config.get('PUE', 'Unknown')}\n",
+            "    ", ("System Energy Counters:", "bold"), f" {energy_counter_status}\n\n    ",
+        ))
+
+        # ------------------------------------------------------
+        # ENERGY INFO: USAGE-BASED AND ENERGY COUNTER-BASED ESTIMATES
+        # ------------------------------------------------------
+        row = total_df.iloc[0].to_dict()  # Get the first and only row of the total_df (as a dict, so every lookup below is a plain dict access)
+
+        # Extract total energy values aggregated over all jobs (from the total_df)
+        energy_total = row['energy_estimated_kwh']
+        energy_no_pue = row["energy_estimated_noPUE_kwh"]
+        cpu_energy = row["CPU_energy_estimated_kwh"]
+        gpu_energy = row["GPU_energy_estimated_kwh"]
+        mem_energy = row["memory_energy_estimated_kwh"]
+        counter_energy = row["EnergyIPMI_kwh"]
+        job_count = row['JobCount']
+        successful_jobs = row['successful_jobs']
+
+        # Derived totals used across the report (data centre overhead, wasted memory emissions and failed jobs) in one vectorised subtraction
+        dc_overhead, wasted_mem_emissions, failed_jobs = (
+            np.array([energy_total, row['Scope2Emissions_gCO2e'], job_count], dtype=np.float64)
+            - np.array([energy_no_pue, row['Scope2Emissions_requiredMem_gCO2e'], successful_jobs], dtype=np.float64)
+        ).tolist()
+        failed_jobs = int(failed_jobs)
+        failed_percent = (failed_jobs / job_count) * 100 if job_count > 0 else 0
+
+        # Message for counter-based energy 
+        if counters_available:
+            counter_energy_msg = f"{counter_energy:,.4f} kWh"
+            job_avg_energy = counter_energy / job_count
+
+        else:
+            counter_energy_msg =  "N/A (not all jobs had energy counters available)"
+            job_avg_energy = energy_total / job_count
+
+        console.print(_SECTION_RULES["⚡️ ENERGY CONSUMPTION"])
+
+        # Print total energy statistics
+        console.print(report_text(
+            "\n    ", ("Total Energy Used (estimated):", "bold"), f" {energy_total:,.4f} kWh\n\n",
+            "         - ", ("CPUs:", "bold"), f" {cpu_energy:,.4f} kWh\n",
+            "         - ", ("GPUs:", "bold"), f" {gpu_energy:,.4f} kWh\n",
+            "         - ", ("Memory:", "bold"), f" {mem_energy:,.4f} kWh\n",
+            "         - ", ("Data Centre Overheads (PUE):", "bold"), f" {dc_overhead:,.4f} kWh\n\n",
+            "    ", ("Compute Energy Use (estimated):", "bold"), f" {energy_no_pue:,.4f} kWh  \n",
+            "    ", ("Compute Energy Use (measured by system counters):", "bold"), f" {counter_energy_msg}\n\n    ",
+        ))
+
+        # ------------------------------------------------------
+        # CARBON FOOTPRINT BOX: SCOPE 2 AND SCOPE 3 EMISSIONS
+        # ------------------------------------------------------
+
+        # Extract emissions values from the total_df
+        scope2_usage = row["Scope2Emissions_gCO2e"]
+        scope2_counter = row["Scope2Emissions_IPMI_gCO2e"]
+        total_emissions = row["TotalEmissions_gCO2e"]
+        scope3_value = row.get("Scope3Emissions_gCO2e", None) if arguments.Scope3 != 'no_scope3' else None
+        failed_scope2 = row['Scope2Emissions_failed_gCO2e']
+
+        # Format every emissions value shown in the report with one vectorised unit conversion
+        (scope2_usage_text, scope2_counter_text, total_emissions_text,
+         scope3_text, failed_scope2_text, wasted_mem_text) = emissions_unit_converter_array(
+            [scope2_usage, scope2_counter, total_emissions, scope3_value if scope3_value is not None else 0, failed_scope2, wasted_mem_emissions])
+
+        total_avg_ci = row["CarbonIntensity_gCO2e_kwh"]
+        # Quartiles of the carbon intensity in one np.quantile call (one partition pass instead of three)
+        ci_values = full_df["CarbonIntensity_gCO2e_kwh"].to_numpy(dtype=np.float64)
+        ci_values = ci_values[~np.isnan(ci_values)]
+        q1, median, q3 = np.quantile(ci_values, (0.25, 0.5, 0.75)) if ci_values.size else (np.nan, np.nan, np.nan)
+
+
+
+        # determine whether to display counter-based scope 2 emissions
+        if counters_available:
+            scope2_counter_msg = scope2_counter_text
+            total_emissions_msg = (
+                f"{total_emissions_text} "
+                f"(system counter-based)"
+            )
+    
+        else:
+            scope2_counter_msg = "N/A (not all jobs had energy counters available)"
+            total_emissions_msg = (
+                f"{total_emissions_text} "
+                f"(usage-based)"
+            )
 
-    # ------------------------------------------------------
-    # CONTEXTUAL EQUIVALENTS BOX AND APPROXIMATE ELECTRICITY COST
-    # ------------------------------------------------------
-    # Extract values from the total_df
-    driving_miles = row["driving_miles"]
-    tree_months = row["tree_absorption_months"]
-    bris_paris_flights = row["bris_paris_flights"]
-    uk_houses = row["uk_houses_daily_emissions"]
+        # Handle scope 3 emissions 
+        scope3_msg = None
 
-    # Format the tree months text 
-    tree_months_text = tree_months_formatter(tree_months)
+        if arguments.Scope3 != 'no_scope3':
+            if scope3_value is not None:
 
-    # Electricity cost using the value given in the hpc_config
-    total_cost = row['Cost_GBP']
-    GBP_per_kwh = hpc_config.get("electricity_cost", "N/A")
+                # Per nodehour scope 3 emissions factor to display next to value
+                scope3_label = scope3_factor_label(arguments.Scope3)
+            
+                # final scope3 text 
+                scope3_msg = f"{scope3_text}{scope3_label}"
+
+        # Print carbon footprint section 
+        console.print(_SECTION_RULES["🌿 CARBON FOOTPRINT"])
+
+        if scope3_msg is not None:
+            scope3_line = (("Scope 3 Emissions:", "bold"), f" {scope3_msg}\n")
+        else:
+            scope3_line = ()
+
+        console.print(report_text(
+            "\n    ", ("Scope 2 Emissions (usage-based):", "bold"), f" {scope2_usage_text}\n",
+            "    ", ("Scope 2 Emissions (system counter-based):", "bold"), f" {scope2_counter_msg}\n",
+            "    ", *scope3_line, "\n",
+            "    ", ("Total Emissions:", "bold"), f" {total_emissions_msg}\n\n",
+            f"    Average Carbon Intensity: {total_avg_ci:,.1f} gCO2e/kWh ({arguments.Region})\n",
+            "    CI distribution (gCO2e/kWh): ", ("Q1:", "bold"), f" {q1:,.1f}, ", ("Median:", "bold"), f" {median:,.1f} , ",
+            ("Q3:", "bold"), f" {q3:,.1f} \n    ",
+        ))
+
+        console.print(_GRID_NOTE_TEXT)
+
+        # ------------------------------------------------------
+        # CONTEXTUAL EQUIVALENTS BOX AND APPROXIMATE ELECTRICITY COST
+        # ------------------------------------------------------
+        # Extract values from the total_df
+        driving_miles = row["driving_miles"]
+        tree_months = row["tree_absorption_months"]
+        bris_paris_flights = row["bris_paris_flights"]
+        uk_houses = row["uk_houses_daily_emissions"]
+
+        # Format the tree months text 
+        tree_months_text = tree_months_formatter(tree_months)
+
+        # Electricity cost using the value given in the hpc_config
+        total_cost = row['Cost_GBP']
+        GBP_per_kwh = hpc_config.get("electricity_cost", "N/A")
+
+        console.print(_SECTION_RULES["THIS IS EQUIVALENT TO:"])
+
+
+        console.print(_EQUIVALENTS_TEMPLATE.format_map({
+            "driving_miles": driving_miles, "tree_months_text": tree_months_text, "bris_paris_flights": bris_paris_flights,
+            "uk_houses": uk_houses, "total_cost": total_cost, "GBP_per_kwh": GBP_per_kwh}))
+
+        # ------------------------------------------------------
+        # USAGE STATISTICS BOX
+        # ------------------------------------------------------
+        # Extract usage statistics from the total_df
+        total_runtime = row['ElapsedRuntime']
+        cpu_usage_time = row['CPUusagetime']
+        gpu_usage_time = row['GPUusagetime']
+        cpu_usage_hours = cpu_usage_time.total_seconds() / 3600
+        gpu_usage_hours = gpu_usage_time.total_seconds() / 3600
+        mem_requested = row['RequestedMemoryGB']
+        node_h = row['NodeHours']
+        cpu_h = row['CPUhours']
+        gpu_h = row['GPUhours']
+        first_job_date = row['FirstJobTime']
+        last_job_date = row['LastJobTime']
 
-    console.print(Rule("THIS IS EQUIVALENT TO:", style="bold cyan"))
+ 
+        console.print(_SECTION_RULES["⚙️ USAGE STATISTICS"])
 
+        # Print usage statistics
+        console.print(report_text(
+            "\n    ", ("Number of Jobs:", "bold"), f" {job_count:,} ({successful_jobs:,} successful)\n",
+            "    ", ("First → Last Job Submitted:", "bold"), f" {str(first_job_date.date())} → {str(last_job_date.date())}\n",
+            "    ", ("Total Runtime:", "bold"), " ", (str(total_runtime), "cyan"), "\n",
+            "    ", ("Total CPU Usage Time:", "bold"), " ", (str(cpu_usage_time), "cyan"), f"  ({cpu_usage_hours:,.0f} hours)\n",
+            "    ", ("Total GPU Usage Time:", "bold"), " ", (str(gpu_usage_time), "cyan"), f"  ({gpu_usage_hours:,.0f} hours)\n",
+            "    ", ("Memory Requested:", "bold"), f" {mem_requested:,} GB\n",
+            "    ", ("Node Hours:", "bold"), f" {node_h:,.1f}\n",
+            "    ", ("CPU Hours:", "bold"), f" {cpu_h:,.1f}\n",
+            "    ", ("GPU Hours:", "bold"), f" {gpu_h:,.1f}\n\n    ",
+        ))
 
-    console.print(f"""
-    [bold]🚗 Driving[/bold] {driving_miles:,.2f} miles            (0.21 kgCO2e/mile average UK car, 2023)
-    [bold]🌲 Tree absorption:[/bold] {tree_months_text}            (0.83 kgCO2e/month average UK tree carbon sequestration rate)
-    [bold]✈️ Flying[/bold] {bris_paris_flights:,.3f} times from Bristol to Paris            (140 kgCO2e/passenger)
-    [bold]🏠 UK Households:[/bold] Daily emissions from {uk_houses:,.1f} households' electricity use             (UK average)
+        # ------------------------------------------------------
+        # FAILED JOBS AND MEMORY OVERALLOCATION 
+        # ------------------------------------------------------
+        # (failed_jobs, failed_percent and wasted_mem_emissions are derived with the energy totals above)
 
-    [bold]Approximate electricity cost:[/bold] £{total_cost:.2f}        (at {GBP_per_kwh:.4f} GBP/kWh)
+        # Section header
+        console.print(_SECTION_RULES["❌ FAILED JOBS & WASTED MEMORY IMPACT"])
 
-    [italic]See documentation for sources and assumptions of these estimates.[/italic]\n
-    """)
-
-    # ------------------------------------------------------
-    # USAGE STATISTICS BOX
-    # ------------------------------------------------------
-    # Extract usage statistics from the total_df
-    job_count = row['JobCount']
-    total_runtime = row['ElapsedRuntime']
-    successful_jobs = row['successful_jobs']
-    cpu_usage_time = row['CPUusagetime']
-    gpu_usage_time = row['GPUusagetime']
-    mem_requested = row['RequestedMemoryGB']
-    node_h = row['NodeHours']
-    cpu_h = row['CPUhours']
-    gpu_h = row['GPUhours']
-    first_job_date = row['FirstJobTime']
-    last_job_date = row['LastJobTime']
+        # Print failed job stats
+        console.print(report_text(
+            "\n    ", ("Failed Jobs:", "bold"), f" {failed_jobs} ({failed_percent:.1f}%)\n",
+            "    ", ("Wasted Scope 2 Emissions:", "bold"), f" {failed_scope2_text} ", ("(Usage-based estimate)", "dim"), "\n    ",
+        ))
 
- 
-    console.print(Rule("⚙️ USAGE STATISTICS", style="bold cyan"))
-
-    # Print usage statistics
-    console.print(f"""
-    [bold]Number of Jobs:[/bold] {job_count:,} ({successful_jobs:,} successful)
-    [bold]First → Last Job Submitted:[/bold] {str(first_job_date.date())} → {str(last_job_date.date())}
-    [bold]Total Runtime:[/bold] [cyan]{total_runtime}[/cyan]
-    [bold]Total CPU Usage Time:[/bold] [cyan]{cpu_usage_time}[/cyan]  ({cpu_usage_time.total_seconds() / 3600:,.0f} hours)
-    [bold]Total GPU Usage Time:[/bold] [cyan]{gpu_usage_time}[/cyan]  ({gpu_usage_time.total_seconds() / 3600:,.0f} hours)
-    [bold]Memory Requested:[/bold] {mem_requested:,} GB
-    [bold]Node Hours:[/bold] {node_h:,.1f}
-    [bold]CPU Hours:[/bold] {cpu_h:,.1f}
-    [bold]GPU Hours:[/bold] {gpu_h:,.1f}\n
-    """)
-
-    # ------------------------------------------------------
-    # FAILED JOBS AND MEMORY OVERALLOCATION 
-    # ------------------------------------------------------
-    # Extract relevant columns
-    failed_jobs = job_count - successful_jobs
-    failed_percent = (failed_jobs / job_count) * 100 if job_count > 0 else 0
-    failed_scope2 = row['Scope2Emissions_failed_gCO2e']
-    scope2_required_memory = row['Scope2Emissions_requiredMem_gCO2e']
-    wasted_mem_emissions = scope2_usage - scope2_required_memory
-
-    # Section header
-    console.print(Rule("❌ FAILED JOBS & WASTED MEMORY IMPACT", style="bold cyan"))
-
-    # Print failed job stats
-    console.print(f"""
-    [bold]Failed Jobs:[/bold] {failed_jobs} ({failed_percent:.1f}%)
-    [bold]Wasted Scope 2 Emissions:[/bold] {emissions_unit_converter(failed_scope2)} [dim](Usage-based estimate)[/dim]
-    """)
-
-    console.print(
-    "\n[italic dim]Note:[/italic dim] Failed HPC jobs are a significant source of wasted computational resources and unnecessary carbon emissions.\n"
-    "Every failed job still consumes electricity for scheduling, startup, and partial execution—without producing useful results.\n"
-    "Reducing failed jobs is a simple yet impactful way to lower your carbon footprint on HPC systems.\n"
-    )
+        console.print(_FAILED_JOBS_NOTE_TEXT)
 
-    console.print(
-    "\n[bold]Memory overallocation[/bold] is a common source of energy waste and excess carbon emissions.\n"
-    "On most HPC systems, power draw depends on the amount of memory [bold]requested[/bold], not the memory actually used.\n"
-    "If all jobs had been submitted with only the memory they truly required, approximately:\n\n"
-    
-    f"{emissions_unit_converter(wasted_mem_emissions)} could have been saved [dim](Usage-based estimate)[/dim]\n\n"
-    )
+        console.print(report_text(
+            "\n", ("Memory overallocation", "bold"), " is a common source of energy waste and excess carbon emissions.\n",
+            "On most HPC systems, power draw depends on the amount of memory ", ("requested", "bold"), ", not the memory actually used.\n",
+            "If all jobs had been submitted with only the memory they truly required, approximately:\n\n",
+            f"{wasted_mem_text} could have been saved ", ("(Usage-based estimate)", "dim"), "\n\n",
+        ))
 
-    # ------------------------------------------------------
-    # DOCUMENTATION AND FEEDBACK TEXT
-    # ------------------------------------------------------
+        # ------------------------------------------------------
+        # DOCUMENTATION AND FEEDBACK TEXT
+        # ------------------------------------------------------
 
-    console.print(Rule("DOCUMENTATION & FEEDBACK", style="bold cyan"))
-    console.print(
-    "\nFind the methodology including assumptions and limitations of this tool outlined in the documentation:\n"
-    "https://github.com/Elliot-Ayliffe/GRACE-HPC/tree/main\n\n"
-    "See also what other features are available with the package/API including an interactive [bold]Jupyter Notebook interface[/bold].\n\n"
-    "If you find any bugs, have questions, or suggestions for improvements, please post these on the GitHub repository.\n"
-)
+        console.print(_SECTION_RULES["DOCUMENTATION & FEEDBACK"])
+        console.print(_DOCS_TEXT)
 
 
 
@@ -388,12 +509,9 @@ def main_cli_script_output(full_df, daily_df, total_df, arguments):
     Returns:
         None: Displays the results in the terminal or Jupyter Notebook.
     """
-    # Load the hpc_config.yaml file (user must edit this file to match their HPC system)
-    with open('hpc_config.yaml', 'r') as file:
-        try: 
-            hpc_config = yaml.safe_load(file)  # Load the YAML file into a dictionary
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error loading hpc_config.yaml: {e}")
+    # Load the hpc_config.yaml file (user must edit this file to match their HPC system).
+    # Parsed once and cached by modification time; the display only reads it, so the cached dictionary is used without a copy
+    hpc_config = load_hpc_config('hpc_config.yaml', copy=False)
         
     # Call the function to display the results
     results_terminal_display(full_df, daily_df, total_df, arguments, hpc_config)
@@ -0,0 +1,154 @@
+"""
+formatters.py
+
+Author: Elliot Ayliffe
+Student ID: 2046374
+Date: 15/07/25
+
+This module contains the text formatting functions shared by the terminal (cli_script_output.py) and 
+Jupyter Notebook (jupyter_output.py) frontends of the GRACE-HPC package. 
+
+They are kept separate from jupyter_output.py so the terminal output does not have to import 
+IPython, ipywidgets and plotly just to format its numbers.
+
+Key Functions:
+
+- 'emissions_unit_converter(gco2e)' / 'emissions_unit_converter_array(gco2e_values)':
+    Format emissions values (gCO2e) as text in g, kg or T (tonnes) depending on their size.
+
+- 'scope3_factor_label(scope3_argument)':
+    Format the per node-hour scope 3 emissions factor displayed next to the scope 3 emissions.
+
+- 'tree_months_formatter(tree_months_value, splitting_years=True)':
+    Format a number of tree-months into readable text, converting to tree-years when appropriate.
+"""
+
+# Import libraries 
+import numpy as np
+
+# Import functions from other modules
+from ..core.emissions_calculator import SCOPE3_FACTORS
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------
+# FORMATTING TEXT CONVERTER FUNCTIONS
+# ---------------------------------------------------------------------------------------------------------------------------------
+
+def emissions_unit_converter(gco2e):
+    """
+    Format the emissions (gCO2e) value into a human-readable string with appropriate units,
+    using g, kg or T (tonnes) depending on the size of the value.
+    
+    Args:
+        gco2e (float): Emissions value in grams of CO2 equivalent (gCO2e).
+        
+    Returns:
+        str: Formatted emissions as text value with appropriate units (e.g. "530 gCO2e")
+    """
+    co2e_text = "CO2e"
+    
+    # If emissions is less than 1000 grams, display in grams
+    if gco2e < 1e3:
+        emissions_text = f"{gco2e:,.4f} g{co2e_text}"             
+
+    # If emissions is between 1000 grams and 1 million grams, display in kilograms
+    elif gco2e < 1e6:
+        emissions_text = f"{gco2e / 1e3:,.4f} kg{co2e_text}"      # Must convert to kg
+
+    # If emissions is greater than 1 million grams, display in tonnes
+    else:
+        emissions_text = f"{gco2e / 1e6:,.4f} T{co2e_text}"        # Must convert to tonnes
+    
+    return emissions_text
+
+
+def emissions_unit_converter_array(gco2e_values):
+    """
+    Vectorised version of 'emissions_unit_converter' that formats several emissions values at once.
+    The g/kg/T unit and the scaled value are chosen for the whole array with np.select, leaving only the
+    string formatting per value.
+
+    Args:
+        gco2e_values (array-like): Emissions values in grams of CO2 equivalent (gCO2e).
+
+    Returns:
+        list of str: Formatted emissions text for each value, identical to 'emissions_unit_converter'.
+    """
+    gco2e = np.asarray(gco2e_values, dtype=np.float64)
+
+    # Magnitude buckets: grams (< 1000 g), kilograms (< 1 million g), otherwise tonnes
+    buckets = [gco2e < 1e3, gco2e < 1e6]
+    scaled = np.select(buckets, [gco2e, gco2e / 1e3], default=gco2e / 1e6)
+    units = np.select(buckets, ["g", "kg"], default="T")
+
+    return [f"{value:,.4f} {unit}CO2e" for value, unit in zip(scaled.tolist(), units.tolist())]
+
+
+def scope3_factor_label(scope3_argument):
+    """
+    Format the per node-hour scope 3 emissions factor that is displayed next to the scope 3 emissions value.
+    The predefined systems are looked up in the backend's SCOPE3_FACTORS dictionary (a single dict lookup), 
+    otherwise the argument is treated as a custom numeric factor.
+
+    Args:
+        scope3_argument (str): The Scope3 argument entered by the user (e.g. 'Isambard3' or '50').
+
+    Returns:
+        str: Label such as " (43 gCO2e/node-hour)", or an empty string if no factor can be displayed.
+    """
+    scope3_nodeh_factor = SCOPE3_FACTORS.get(scope3_argument)
+
+    if scope3_nodeh_factor is not None:
+        scope3_nodeh_factor = f"{scope3_nodeh_factor:g}"        # predefined factors are whole numbers (e.g. 43 rather than 43.0)
+    else:                                                       # If the user gives a custom numeric value (e.g. "50") instead of a system name
+        try:
+            scope3_nodeh_factor = float(scope3_argument)
+        except (TypeError, ValueError):
+            return ""       # don't display the per nodehour emissions factor
+
+    return f" ({scope3_nodeh_factor} gCO2e/node-hour)"
+
+
+
+def tree_months_formatter(tree_months_value, splitting_years=True):
+    """
+    Format a given number of 'tree-months' into a more human-readable string.
+
+    A tree-month is a proxy metric representing how many months a tree would need to absorb
+    a given amount of carbon. This function provides readable formatting depending on the
+    size of the value, converting to tree-years when appropriate
+
+    Args:
+        tree_months_value (float): The number of tree-months to format.
+        splitting_years (bool): If True, splits larger values into years and months.
+    
+    Returns:
+        str: Formatted string representing the tree-months value.
+    """
+    tm_int = int(tree_months_value)  # Convert to integer for formatting
+    tree_years = int(tm_int / 12)  # Calculate full tree-years
+
+    # For small values,
+    if tm_int < 1:
+        formatted_tm_text = f"{tree_months_value:.3f} tree-months"
+
+    # values less than 12 months
+    elif tm_int < 12:
+        formatted_tm_text = f"{tree_months_value:.1f} tree-months"
+
+    # for values up to 2 years 
+    elif tm_int < 24:
+        formatted_tm_text = f"{tm_int} tree-months"
+
+    # For values up to 10 years 
+    elif tm_int < 120:
+        if splitting_years:
+            remaining_months = tm_int - tree_years * 12
+            formatted_tm_text = f"{tree_years} tree-years and {remaining_months} tree-months"
+        else:
+            formatted_tm_text = f"{tree-years} tree-years"
+    
+    else:
+        formatted_tm_text = f"{tree_months_value / 12:.1f} tree-years"
+
+    return formatted_tm_text
@@ -28,86 +28,14 @@ import plotly.express as px
 import datetime
 import pandas as pd 
 import numpy as np
-import yaml
-
-
-# ---------------------------------------------------------------------------------------------------------------------------------
-# FORMATTING TEXT CONVERTER FUNCTIONS
-# ---------------------------------------------------------------------------------------------------------------------------------
-
-def emissions_unit_converter(gco2e):
-    """
-    Format the emissions (gCO2e) value into a human-readable string with appropriate units,
-    using g, kg or T (tonnes) depending on the size of the value.
-    
-    Args:
-        gco2e (float): Emissions value in grams of CO2 equivalent (gCO2e).
-        
-    Returns:
-        str: Formatted emissions as text value with appropriate units (e.g. "530 gCO2e")
-    """
-    co2e_text = "CO2e"
-    
-    # If emissions is less than 1000 grams, display in grams
-    if gco2e < 1e3:
-        emissions_text = f"{gco2e:,.4f} g{co2e_text}"             
-
-    # If emissions is between 1000 grams and 1 million grams, display in kilograms
-    elif gco2e < 1e6:
-        emissions_text = f"{gco2e / 1e3:,.4f} kg{co2e_text}"      # Must convert to kg
-
-    # If emissions is greater than 1 million grams, display in tonnes
-    else:
-        emissions_text = f"{gco2e / 1e6:,.4f} T{co2e_text}"        # Must convert to tonnes
-    
-    return emissions_text
-
-
-
-def tree_months_formatter(tree_months_value, splitting_years=True):
-    """
-    Format a given number of 'tree-months' into a more human-readable string.
-
-    A tree-month is a proxy metric representing how many months a tree would need to absorb
-    a given amount of carbon. This function provides readable formatting depending on the
-    size of the value, converting to tree-years when appropriate
-
-    Args:
-        tree_months_value (float): The number of tree-months to format.
-        splitting_years (bool): If True, splits larger values into years and months.
-    
-    Returns:
-        str: Formatted string representing the tree-months value.
-    """
-    tm_int = int(tree_months_value)  # Convert to integer for formatting
-    tree_years = int(tm_int / 12)  # Calculate full tree-years
-
-    # For small values,
-    if tm_int < 1:
-        formatted_tm_text = f"{tree_months_value:.3f} tree-months"
-
-    # values less than 12 months
-    elif tm_int < 12:
-        formatted_tm_text = f"{tree_months_value:.1f} tree-months"
-
-    # for values up to 2 years 
-    elif tm_int < 24:
-        formatted_tm_text = f"{tm_int} tree-months"
-
-    # For values up to 10 years 
-    elif tm_int < 120:
-        if splitting_years:
-            remaining_months = tm_int - tree_years * 12
-            formatted_tm_text = f"{tree_years} tree-years and {remaining_months} tree-months"
-        else:
-            formatted_tm_text = f"{tree-years} tree-years"
-    
-    else:
-        formatted_tm_text = f"{tree_months_value / 12:.1f} tree-years"
-
-    return formatted_tm_text
 
+# Import functions from other modules
+from ..config import load_hpc_config
+from .formatters import emissions_unit_converter, scope3_factor_label, tree_months_formatter
 
+# Number of jobs above which the job scatter plot is rendered with WebGL (Scattergl) instead of SVG (Scatter).
+# SVG markers are crisper but become slow to draw, zoom and hover once there are a few thousand of them.
+_WEBGL_POINT_THRESHOLD = 2000
 
 
 # ---------------------------------------------------------------------------------------------------------------------------------
@@ -183,7 +111,7 @@ def scope2_scope3_pie(total_df, arguments):
     Returns:
         fig (plotly.graph_objs.Figure): Plotly pie chart figure object showing scope 2 and scope 3 emissions.
     """
-    row = total_df.iloc[0]  # Get the first row of the total_df DataFrame
+    row = total_df.iloc[0].to_dict()  # Get the first row of the total_df DataFrame (as a dict for plain lookups)
 
     # If no scope 3 specified, return None (no pie chart)
     if arguments.Scope3 == "no_scope3":
@@ -266,8 +194,11 @@ def scatter_full_jobs(full_df):
     successful_jobs = df[df['StateCode'] == 1]
     failed_jobs = df[df['StateCode'] == 0]
 
+    # Use WebGL rendering for large numbers of jobs (same arguments, drawn on the GPU instead of as SVG elements)
+    scatter_trace = go.Scattergl if len(df) > _WEBGL_POINT_THRESHOLD else go.Scatter
+
     # Scatter plot for successful jobs
-    successful_trace = go.Scatter(
+    successful_trace = scatter_trace(
         x=successful_jobs['SubmissionTime'],
         y=successful_jobs['TotalEmissions_gCO2e'],
         mode='markers',
@@ -278,7 +209,7 @@ def scatter_full_jobs(full_df):
     )
 
     # Scatter plot for failed jobs
-    failed_trace = go.Scatter(
+    failed_trace = scatter_trace(
         x=failed_jobs['SubmissionTime'],
         y=failed_jobs['TotalEmissions_gCO2e'],
         mode='markers',
@@ -295,6 +226,7 @@ def scatter_full_jobs(full_df):
         xaxis=dict(title="Submission DateTime"),
         yaxis=dict(title="Total Emissions (gCO2e)"),
         legend=dict(title="Job Status"),
+        hovermode='closest',        # hover the nearest point only (unified x hover is slow with many points)
         height=400,
         margin=dict(l=60, r=30, t=40, b=50)
     )
@@ -440,8 +372,8 @@ def success_failure_pie(total_df):
     Returns:
         fig (plotly.graph_objs.Figure): Plotly pie chart figure object showing success vs failure.
     """
-    # Get the first row from the total_df DataFrame
-    row = total_df.iloc[0]
+    # Get the first row from the total_df DataFrame (as a dict for plain lookups)
+    row = total_df.iloc[0].to_dict()
 
     # Get fractions and total job count
     total_jobs = row['JobCount']
@@ -596,7 +528,7 @@ Hence this tool should be used for **informational purposes only**, not as a def
         return
 
     # Extract variables from arguments and data 
-    user_name = full_df.iloc[0].get("UserName", "N/A")
+    user_name = full_df["UserName"].iat[0] if "UserName" in full_df.columns else "N/A"     # positional scalar lookup (no row Series is built)
     start_date = arguments.StartDate if hasattr(arguments, "StartDate") else "N/A"
     end_date = arguments.EndDate if hasattr(arguments, "EndDate") else "N/A"
     hpc_name = hpc_config.get('hpc_system', 'Unknown HPC System')
@@ -639,7 +571,7 @@ Hence this tool should be used for **informational purposes only**, not as a def
     # ------------------------------------------------------
     # ENERGY BOX: USAGE-BASED AND ENERGY COUNTER-BASED ESTIMATES
     # ------------------------------------------------------
-    row = total_df.iloc[0]  # Get the first and only row of the total_df
+    row = total_df.iloc[0].to_dict()  # Get the first and only row of the total_df (as a dict, so every lookup below is a plain dict access)
 
     # Extract total energy values aggregated over all jobs (from the total_df)
     energy_total = row['energy_estimated_kwh']
@@ -727,25 +659,8 @@ Hence this tool should be used for **informational purposes only**, not as a def
         scope3_value = row.get("Scope3Emissions_gCO2e", None)
         if scope3_value is not None:
 
-            scope3_label = ""
-            scope3_nodeh_factor = None
-
-            # Determine the per nodehour scope 3 emissions factor to display next to value
-            if arguments.Scope3 == 'Isambard3':
-                scope3_nodeh_factor = 43
-            elif arguments.Scope3 == 'IsambardAI':
-                scope3_nodeh_factor = 114
-            elif arguments.Scope3 == 'Archer2':
-                scope3_nodeh_factor = 23
-            else:                                   # If the user gives a custom numeric value (e.g. "50") instead of a system name
-                try:
-                    scope3_nodeh_factor = float(arguments.Scope3)
-                except Exception:
-                    pass        # don't display the per nodehour emissions factor
-            
-
-            if scope3_nodeh_factor is not None:
-                scope3_label = f" ({scope3_nodeh_factor} gCO2e/node-hour)"
+            # Per nodehour scope 3 emissions factor to display next to value
+            scope3_label = scope3_factor_label(arguments.Scope3)
             
             # final scope3 text 
             scope3_msg = f"{emissions_unit_converter(scope3_value)}{scope3_label}"
@@ -849,12 +764,13 @@ Hence this tool should be used for **informational purposes only**, not as a def
     # ------------------------------------------------------
     # USAGE STATISTICS BOX
     # ------------------------------------------------------
-    # Extract usage statistics from the total_df
-    job_count = row['JobCount']
+    # Extract usage statistics from the total_df (job_count was already read for the energy box)
     total_runtime = row['ElapsedRuntime']
     successful_jobs = row['successful_jobs']
     cpu_usage_time = row['CPUusagetime']
     gpu_usage_time = row['GPUusagetime']
+    cpu_usage_hours = cpu_usage_time.total_seconds() / 3600
+    gpu_usage_hours = gpu_usage_time.total_seconds() / 3600
     mem_requested = row['RequestedMemoryGB']
     node_h = row['NodeHours']
     cpu_h = row['CPUhours']
@@ -872,8 +788,8 @@ Hence this tool should be used for **informational purposes only**, not as a def
             <li><strong>Number of Jobs:</strong> {job_count:,} <span style="color: #555;">({successful_jobs:,} successful)</span></li>
             <li><strong>First → Last Job Submitted:</strong> {str(first_job_date.date())} → {str(last_job_date.date())}</li>
             <li><strong>Total Runtime:</strong> {total_runtime}</li>
-            <li><strong>Total CPU Usage Time:</strong> {cpu_usage_time} <span style="color: #555;">({cpu_usage_time.total_seconds() / 3600:,.0f} hours)</span></li>
-            <li><strong>Total GPU Usage Time:</strong> {gpu_usage_time} <span style="color: #555;">({gpu_usage_time.total_seconds() / 3600:,.0f} hours)</span></li>
+            <li><strong>Total CPU Usage Time:</strong> {cpu_usage_time} <span style="color: #555;">({cpu_usage_hours:,.0f} hours)</span></li>
+            <li><strong>Total GPU Usage Time:</strong> {gpu_usage_time} <span style="color: #555;">({gpu_usage_hours:,.0f} hours)</span></li>
             <li><strong>Memory Requested:</strong> {mem_requested:,} GB</li>
             <li><strong>Node Hours:</strong> {node_h:,.1f}</li>
             <li><strong>CPU Hours:</strong> {cpu_h:,.1f}</li>
@@ -1013,11 +929,7 @@ def main_jupyter_output(full_df, daily_df, total_df, arguments):
         None: Displays the results in the Jupyter Notebook.
     """
     # Load the hpc_config.yaml file (user must edit this file to match their HPC system)
-    with open('hpc_config.yaml', 'r') as file:
-        try: 
-            hpc_config = yaml.safe_load(file)  # Load the YAML file into a dictionary
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error loading hpc_config.yaml: {e}")
+    hpc_config = load_hpc_config('hpc_config.yaml')
 
     # Call function to generate the Jupyter Notebook result plotting function 
     JN_stats_plots(full_df, daily_df, total_df, arguments, hpc_config)
\ No newline at end of file
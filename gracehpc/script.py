@@ -29,7 +29,7 @@ from .interface.cli_script_output import main_cli_script_output
 
 
 # Function to convert user inputs into compatible arguments for the core_engine
-def build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV):
+def build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV, Format="csv", Engine="pandas"):
     """
     Convert user inputs into an argparse.Namespace object that mimics the CLI 'run' command arguments.
     This format is necessary for the core_engine to process the data correctly.
@@ -41,6 +41,8 @@ def build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV):
         Region (str): UK region for carbon intensity data. 
         Scope3 (str): Scope 3 emissions option.
         CSV (str): Option to save data to CSV files.
+        Format (str): File format for the saved data ('csv' or 'parquet').
+        Engine (str): Dataframe library used to merge the job steps and for the daily aggregation ('pandas' or 'polars').
 
     Returns:
         argparse.Namespace: An object containing the arguments in a format compatible with the core_engine (tool backend).
@@ -52,12 +54,14 @@ def build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV):
         JobIDs=JobIDs,
         Region=Region,
         Scope3=Scope3,
-        CSV=CSV
+        CSV=CSV,
+        Format=Format,
+        Engine=Engine
     )
 
 
 # Main function to run the full tool from a script
-def gracehpc_run(StartDate=f"{datetime.date.today().year}-01-01", EndDate=datetime.date.today().strftime("%Y-%m-%d"), JobIDs="all_jobs", Region="UK_average", Scope3="no_scope3", CSV="no_save"):
+def gracehpc_run(StartDate=f"{datetime.date.today().year}-01-01", EndDate=datetime.date.today().strftime("%Y-%m-%d"), JobIDs="all_jobs", Region="UK_average", Scope3="no_scope3", CSV="no_save", Format="csv", Engine="pandas"):
     """
     Run the GRACE-HPC tool programmatically in a script (alternative to CLI).
     
@@ -101,6 +105,10 @@ def gracehpc_run(StartDate=f"{datetime.date.today().year}-01-01", EndDate=dateti
             - 'total'         : dataset aggregated over all total jobs with all columns  
             - 'total_summary' : dataset aggregated over all total jobs with summary columns only  
             - 'all'           : all of the above datasets saved to CSV files
+        Format (str, optional): File format used to save the datasets selected with CSV. 'csv' (default) or 'parquet' 
+            (compressed columnar format that preserves column types; requires pyarrow).
+        Engine (str, optional): Dataframe library used to merge the job steps into jobs and to aggregate the jobs by day. 'pandas' (default) or 'polars' 
+            (multi-threaded lazy aggregation for very large numbers of jobs; requires polars and pyarrow).
 
     
     Raises: 
@@ -122,7 +130,7 @@ def gracehpc_run(StartDate=f"{datetime.date.today().year}-01-01", EndDate=dateti
     """
 
     # Convert the user inputs into an argparse.Namespace object
-    arguments = build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV)
+    arguments = build_args(StartDate, EndDate, JobIDs, Region, Scope3, CSV, Format, Engine)
 
     # Validate the date arguments are correct 
     try: